@@ -1,6 +1,5 @@
 """Base analyzer class for workflow extraction from OpenAPI specifications."""
 
-from abc import ABC, abstractmethod
 from typing import Any
 
 from arazzo_generator.utils.logging import get_logger
@@ -8,14 +7,20 @@ from arazzo_generator.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
-class BaseAnalyzer(ABC):
+class BaseAnalyzer:
     """Base class for all workflow analyzers.
 
-    This abstract class defines the common interface that all analyzer
+    This class defines the common interface that all analyzer
     implementations must follow. It provides a consistent way to analyze
-    OpenAPI specifications and extract workflows.
+    OpenAPI specifications and extract workflows. Subclasses must override
+    :meth:`analyze`.
+
+    The base attributes are stored in ``__slots__``; subclasses only avoid a
+    per-instance ``__dict__`` if they declare ``__slots__`` as well.
     """
 
+    __slots__ = ("endpoints", "relationships", "workflows")
+
     def __init__(self, endpoints: dict[str, dict], relationships: dict | None = None):
         """Initialize the base analyzer.
 
@@ -27,14 +32,16 @@ class BaseAnalyzer(ABC):
         self.relationships = relationships or {}
         self.workflows = []
 
-    @abstractmethod
     def analyze(self) -> list[dict[str, Any]]:
         """Analyze the OpenAPI specification to identify workflows.
 
         This method should be implemented by subclasses to perform the
         actual analysis and workflow extraction.
+
+        Raises:
+            NotImplementedError: If the subclass does not implement it.
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement analyze()")
 
     def get_workflows(self) -> list[dict[str, Any]]:
         """Get the list of identified workflows.
@@ -26,6 +26,7 @@ class WorkflowBuilder:
         self.openapi_spec = openapi_spec
         self.step_id_map = {}
         self.workflow = None  # Store the original workflow
+        self._resolved_refs = {}  # Memoized component lookups keyed by $ref
 
     def create_workflow(self, workflow: dict[str, Any]) -> dict[str, Any] | None:
         """Create an Arazzo workflow from an identified workflow.
@@ -244,6 +245,9 @@ class WorkflowBuilder:
         Returns:
             A dictionary containing the resolved definition, or an empty dict if resolution fails.
         """
+        if ref in self._resolved_refs:
+            return self._resolved_refs[ref]
+
         resolved_item = {}
 
         try:
@@ -260,6 +264,7 @@ class WorkflowBuilder:
                         components = self.openapi_spec.get("components", {})
                         component_dict = components.get(component_type, {})
                         if component_key in component_dict:
+                            self._resolved_refs[ref] = component_dict[component_key]
                             return component_dict[component_key]
 
                     # Fallback: Try to find the component in the endpoints data
@@ -269,6 +274,7 @@ class WorkflowBuilder:
                             components = endpoint_data.get("components", {})
                             component_dict = components.get(component_type, {})
                             if component_key in component_dict:
+                                self._resolved_refs[ref] = component_dict[component_key]
                                 return component_dict[component_key]
 
                 logger.warning(f"Reference not found: {ref}")
@@ -14,8 +14,31 @@ from prance.util.url import absurl
 
 from arazzo_generator.utils.logging import get_logger
 
+try:
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as YAMLSafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as YAMLSafeLoader
+
 logger = get_logger(__name__)
 
+# Problematic characters replaced by OpenAPIParser._clean_spec_content
+_CLEAN_SPEC_TRANSLATION = str.maketrans(
+    {
+        "\u00a0": " ",  # non-breaking space
+        "\u2013": "-",  # en dash
+        "\u2014": "-",  # em dash
+        "\u201c": '"',  # left double quote
+        "\u201d": '"',  # right double quote
+        "\u2018": "'",  # left single quote
+        "\u2019": "'",  # right single quote
+    }
+)
+
+# Patterns used by OpenAPIParser._fix_yaml_structure, compiled once at import
+_MISSING_SPACE_AFTER_COLON_RE = re.compile(r"([a-zA-Z0-9_-]+):([$a-zA-Z0-9])")
+_MISSING_LINE_BREAK_RE = re.compile(r"([a-zA-Z0-9_-]+): ([^{\[\n].*?)([a-zA-Z0-9_-]+):")
+
 
 class OpenAPIParser:
     """OpenAPI specification parser.
@@ -41,6 +64,7 @@ class OpenAPIParser:
         self.components = {}
         self.version = None
         self.parser = None
+        self._endpoints = None
 
     def fetch_spec(self) -> dict[str, Any]:
         """Fetch the OpenAPI specification from the URL.
@@ -129,14 +153,14 @@ class OpenAPIParser:
             except json.JSONDecodeError:
                 # Try as YAML
                 try:
-                    spec = yaml.safe_load(content)
+                    spec = yaml.load(content, Loader=YAMLSafeLoader)
                     logger.debug("Successfully parsed spec as YAML", extra={"url": self.url})
                 except yaml.YAMLError as e1:
                     # Try to fix common YAML structural issues
                     logger.warning(f"YAML parsing failed: {e1}", extra={"url": self.url})
                     fixed_content = self._fix_yaml_structure(content)
                     try:
-                        spec = yaml.safe_load(fixed_content)
+                        spec = yaml.load(fixed_content, Loader=YAMLSafeLoader)
                         logger.info(
                             "Successfully parsed spec after fixing YAML structure",
                             extra={"url": self.url},
@@ -175,25 +199,14 @@ class OpenAPIParser:
         Returns:
             The cleaned content.
         """
-        # Replace common problematic characters
         cleaned = content
 
         # Replace UTF-8 BOM if present
         if cleaned.startswith("\ufeff"):
             cleaned = cleaned[1:]
 
-        # Replace non-breaking spaces with regular spaces
-        cleaned = cleaned.replace("\u00a0", " ")
-
-        # Replace various dash characters with standard dash
-        cleaned = cleaned.replace("\u2013", "-")  # en dash
-        cleaned = cleaned.replace("\u2014", "-")  # em dash
-
-        # Replace smart quotes with straight quotes
-        cleaned = cleaned.replace("\u201c", '"')  # left double quote
-        cleaned = cleaned.replace("\u201d", '"')  # right double quote
-        cleaned = cleaned.replace("\u2018", "'")  # left single quote
-        cleaned = cleaned.replace("\u2019", "'")  # right single quote
+        # Replace non-breaking spaces, dashes and smart quotes in a single pass
+        cleaned = cleaned.translate(_CLEAN_SPEC_TRANSLATION)
 
         # Handle Windows line endings
         cleaned = cleaned.replace("\r\n", "\n")
@@ -213,10 +226,10 @@ class OpenAPIParser:
         fixed = content
 
         # Fix missing spaces after colons in mappings
-        fixed = re.sub(r"([a-zA-Z0-9_-]+):([$a-zA-Z0-9])", r"\1: \2", fixed)
+        fixed = _MISSING_SPACE_AFTER_COLON_RE.sub(r"\1: \2", fixed)
 
         # Fix missing line breaks between mappings
-        fixed = re.sub(r"([a-zA-Z0-9_-]+): ([^{\[\n].*?)([a-zA-Z0-9_-]+):", r"\1: \2\n\3:", fixed)
+        fixed = _MISSING_LINE_BREAK_RE.sub(r"\1: \2\n\3:", fixed)
 
         # Fix indentation of nested mappings
         lines = fixed.split("\n")
@@ -257,7 +270,7 @@ class OpenAPIParser:
             # Decode with lenient encoding
             text_content = content.decode("utf-8", errors="replace")
             cleaned_content = self._clean_spec_content(text_content)
-            spec = yaml.safe_load(cleaned_content)
+            spec = yaml.load(cleaned_content, Loader=YAMLSafeLoader)
             logger.info("Successfully parsed spec with safe YAML loader", extra={"url": self.url})
             return spec
         except Exception as e:
@@ -341,15 +354,24 @@ class OpenAPIParser:
         # Get components
         self.components = self.spec.get("components", {})
 
+        # Endpoints are derived from the paths, so rebuild them on next access
+        self._endpoints = None
+
     def get_endpoints(self) -> dict[str, dict[str, Any]]:
         """Extract all endpoints from the OpenAPI specification.
 
+        The endpoints are built once per fetched specification and reused on
+        subsequent calls.
+
         Returns:
             A dictionary of all endpoints with their methods, parameters, and schemas.
         """
         if not self.spec:
             self.fetch_spec()
 
+        if self._endpoints is not None:
+            return self._endpoints
+
         endpoints = {}
 
         for path, path_item in self.paths.items():
@@ -387,6 +409,7 @@ class OpenAPIParser:
             if endpoint_data:
                 endpoints[path] = endpoint_data
 
+        self._endpoints = endpoints
         return endpoints
 
     def get_schemas(self) -> dict[str, Any]:
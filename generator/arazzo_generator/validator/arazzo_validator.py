@@ -30,6 +30,7 @@ class ArazzoValidator:
     def __init__(self):
         """Initialize the Arazzo validator."""
         self.schema = None
+        self._validator = None
 
     def load_schema(self) -> dict[str, Any]:
         """Load the Arazzo schema.
@@ -95,6 +96,26 @@ class ArazzoValidator:
             logger.warning(f"Failed to load Arazzo schema from URL: {e}")
             raise ValueError("Failed to load Arazzo schema from local files or URL") from e
 
+    def _get_validator(self) -> jsonschema.protocols.Validator:
+        """Get a JSON Schema validator compiled for the current schema.
+
+        The validator is built once and reused for as long as ``self.schema`` is
+        the same object, so the schema is only checked and compiled once.
+
+        Returns:
+            The compiled validator.
+
+        Raises:
+            jsonschema.exceptions.SchemaError: If the loaded schema is itself invalid.
+        """
+        if self._validator is None or self._validator.schema is not self.schema:
+            validator_class = jsonschema.validators.validator_for(
+                self.schema, default=jsonschema.Draft202012Validator
+            )
+            validator_class.check_schema(self.schema)
+            self._validator = validator_class(self.schema)
+        return self._validator
+
     def validate(self, arazzo_spec: dict[str, Any] | str) -> bool:
         """Validate an Arazzo specification against the schema.
 
@@ -117,14 +138,14 @@ class ArazzoValidator:
                 return False
 
         # Validate the specification
-        try:
-            jsonschema.validate(instance=arazzo_spec, schema=self.schema)
-            logger.info("Arazzo specification validation successful")
-            return True
-        except jsonschema.exceptions.ValidationError as e:
-            logger.error(f"Arazzo specification validation failed: {e}")
+        error = jsonschema.exceptions.best_match(self._get_validator().iter_errors(arazzo_spec))
+        if error is not None:
+            logger.error(f"Arazzo specification validation failed: {error}")
             return False
 
+        logger.info("Arazzo specification validation successful")
+        return True
+
     def get_validation_errors(self, arazzo_spec: dict[str, Any] | str) -> list[str]:
         """Get validation errors for an Arazzo specification.
 
@@ -146,8 +167,7 @@ class ArazzoValidator:
                 return [f"Failed to parse Arazzo spec as YAML: {e}"]
 
         # Validate the specification and collect errors
-        validator = jsonschema.Draft202012Validator(self.schema)
-        errors = list(validator.iter_errors(arazzo_spec))
+        errors = list(self._get_validator().iter_errors(arazzo_spec))
 
         # Format error messages
         error_messages = []
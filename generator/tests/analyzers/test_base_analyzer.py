@@ -11,7 +11,7 @@ class TestBaseAnalyzer(unittest.TestCase):
     def test_init(self):
         """Test initialization of the BaseAnalyzer."""
 
-        # Create a concrete subclass for testing since BaseAnalyzer is abstract
+        # Create a concrete subclass for testing since BaseAnalyzer has no analyze()
         class ConcreteAnalyzer(BaseAnalyzer):
             def analyze(self):
                 return []
@@ -49,11 +49,17 @@ class TestBaseAnalyzer(unittest.TestCase):
         self.assertEqual(workflows[0]["name"], "workflow1")
         self.assertEqual(workflows[1]["name"], "workflow2")
 
-    def test_analyze_abstract(self):
-        """Test that BaseAnalyzer.analyze is abstract and must be implemented by subclasses."""
-        # Attempting to instantiate BaseAnalyzer directly should raise TypeError
-        with self.assertRaises(TypeError):
-            BaseAnalyzer({})
+    def test_analyze_not_implemented(self):
+        """Test that BaseAnalyzer.analyze must be implemented by subclasses."""
+        # Calling analyze on an analyzer that does not override it should raise
+        with self.assertRaises(NotImplementedError):
+            BaseAnalyzer({}).analyze()
+
+    def test_slots(self):
+        """Test that BaseAnalyzer stores its attributes in slots."""
+        analyzer = BaseAnalyzer({})
+        self.assertFalse(hasattr(analyzer, "__dict__"))
+        self.assertEqual(analyzer.workflows, [])
 
 
 if __name__ == "__main__":
@@ -523,6 +523,18 @@ class TestWorkflowBuilder(unittest.TestCase):
                 workflow["workflowId"], to_kebab_case(self.identified_workflow["name"])
             )
 
+    def test_resolve_reference_memoized(self):
+        """Test that resolved component references are memoized per $ref."""
+        spec = {"components": {"schemas": {"Pet": {"type": "object"}}}}
+        builder = WorkflowBuilder(self.endpoints, spec)
+
+        resolved = builder._resolve_reference("#/components/schemas/Pet")
+        self.assertEqual(resolved, {"type": "object"})
+
+        # A second lookup is served from the memo without touching the spec
+        spec["components"] = {}
+        self.assertIs(builder._resolve_reference("#/components/schemas/Pet"), resolved)
+
 
 if __name__ == "__main__":
     unittest.main()
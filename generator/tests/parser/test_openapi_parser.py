@@ -1,243 +1,248 @@
 """Tests for the OpenAPI parser module."""
 
-import unittest
 from unittest.mock import patch
 
-from arazzo_generator.parser.openapi_parser import OpenAPIParser
-
-
-class TestOpenAPIParser(unittest.TestCase):
-    """Tests for the OpenAPIParser class."""
+import prance
+import pytest
 
-    def setUp(self):
-        """Set up the test case."""
-        # Reset any class variables or state before each test
-        pass
+from arazzo_generator.parser.openapi_parser import OpenAPIParser
 
-    @patch.object(OpenAPIParser, "_fetch_and_parse_with_fallbacks")
-    def test_fetch_spec_json(self, mock_fetch):
-        """Test fetching a JSON OpenAPI spec."""
-        # Prepare test data
-        test_spec = {
-            "openapi": "3.0.0",
-            "info": {"title": "Test API", "version": "1.0.0"},
-            "paths": {
-                "/test": {
-                    "get": {
-                        "operationId": "getTest",
-                        "responses": {"200": {"description": "OK"}},
+# Minimal spec with a single endpoint
+TEST_SPEC = {
+    "openapi": "3.0.0",
+    "info": {"title": "Test API", "version": "1.0.0"},
+    "paths": {
+        "/test": {
+            "get": {
+                "operationId": "getTest",
+                "responses": {"200": {"description": "OK"}},
+            }
+        }
+    },
+}
+
+# Spec with endpoints that carry parameters and request bodies
+ENDPOINTS_SPEC = {
+    "openapi": "3.0.0",
+    "info": {"title": "Test API", "version": "1.0.0"},
+    "paths": {
+        "/users": {
+            "get": {
+                "operationId": "getUsers",
+                "parameters": [
+                    {
+                        "name": "limit",
+                        "in": "query",
+                        "schema": {"type": "integer"},
+                    }
+                ],
+                "responses": {"200": {"description": "OK"}},
+            },
+            "post": {
+                "operationId": "createUser",
+                "requestBody": {
+                    "content": {
+                        "application/json": {"schema": {"$ref": "#/components/schemas/User"}}
                     }
-                }
+                },
+                "responses": {"201": {"description": "Created"}},
             },
         }
+    },
+}
+
+# Spec with component schemas
+SCHEMAS_SPEC = {
+    "openapi": "3.0.0",
+    "info": {"title": "Test API", "version": "1.0.0"},
+    "paths": {},
+    "components": {
+        "schemas": {
+            "User": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    "name": {"type": "string"},
+                },
+            }
+        }
+    },
+}
+
+# Spec with security schemes
+SECURITY_SPEC = {
+    "openapi": "3.0.0",
+    "info": {"title": "Test API", "version": "1.0.0"},
+    "paths": {},
+    "components": {
+        "securitySchemes": {
+            "bearerAuth": {
+                "type": "http",
+                "scheme": "bearer",
+                "bearerFormat": "JWT",
+            }
+        }
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def shared_parsers():
+    """Create the parsers shared by all tests in the module."""
+    # Skip prance so fetch_spec goes straight to the mocked fallback parser
+    # instead of attempting a network fetch of the example URLs
+    with patch.object(prance, "BaseParser", side_effect=ValueError("prance disabled for tests")):
+        yield {
+            "json": OpenAPIParser("https://example.com/openapi.json"),
+            "yaml": OpenAPIParser("https://example.com/openapi.yaml"),
+        }
+
+
+@pytest.fixture
+def json_parser(shared_parsers):
+    """Shared JSON parser, reset so each test fetches its own spec."""
+    parser = shared_parsers["json"]
+    parser.spec = None
+    return parser
+
+
+@pytest.fixture
+def yaml_parser(shared_parsers):
+    """Shared YAML parser, reset so each test fetches its own spec."""
+    parser = shared_parsers["yaml"]
+    parser.spec = None
+    return parser
 
-        # Configure the mock to return our test data
-        mock_fetch.return_value = test_spec
 
-        # Create parser and fetch spec
-        parser = OpenAPIParser("https://example.com/openapi.json")
-        spec = parser.fetch_spec()
+@pytest.fixture
+def mock_fetch():
+    """Patch the fallback fetcher so tests can supply the parsed spec."""
+    with patch.object(OpenAPIParser, "_fetch_and_parse_with_fallbacks") as mock:
+        yield mock
+
+
+class TestOpenAPIParser:
+    """Tests for the OpenAPIParser class."""
+
+    def test_fetch_spec_json(self, json_parser, mock_fetch):
+        """Test fetching a JSON OpenAPI spec."""
+        mock_fetch.return_value = TEST_SPEC
+
+        spec = json_parser.fetch_spec()
 
         # Check that the spec was parsed correctly
-        self.assertEqual(spec["openapi"], "3.0.0")
-        self.assertEqual(spec["info"]["title"], "Test API")
-        self.assertEqual(spec["paths"]["/test"]["get"]["operationId"], "getTest")
+        assert spec["openapi"] == "3.0.0"
+        assert spec["info"]["title"] == "Test API"
+        assert spec["paths"]["/test"]["get"]["operationId"] == "getTest"
 
         # Check that the metadata was extracted
-        self.assertEqual(parser.version, "3.0.0")
-        self.assertIn("/test", parser.paths)
+        assert json_parser.version == "3.0.0"
+        assert "/test" in json_parser.paths
 
-    @patch.object(OpenAPIParser, "_fetch_and_parse_with_fallbacks")
-    def test_fetch_spec_yaml(self, mock_fetch):
+    def test_fetch_spec_yaml(self, yaml_parser, mock_fetch):
         """Test fetching a YAML OpenAPI spec."""
-        # Prepare test data
-        test_spec = {
-            "openapi": "3.0.0",
-            "info": {"title": "Test API", "version": "1.0.0"},
-            "paths": {
-                "/test": {
-                    "get": {
-                        "operationId": "getTest",
-                        "responses": {"200": {"description": "OK"}},
-                    }
-                }
-            },
-        }
-
-        # Configure the mock to return our test data
-        mock_fetch.return_value = test_spec
+        mock_fetch.return_value = TEST_SPEC
 
-        # Create parser and fetch spec
-        parser = OpenAPIParser("https://example.com/openapi.yaml")
-        spec = parser.fetch_spec()
+        spec = yaml_parser.fetch_spec()
 
         # Check that the spec was parsed correctly
-        self.assertEqual(spec["openapi"], "3.0.0")
-        self.assertEqual(spec["info"]["title"], "Test API")
-        self.assertEqual(spec["paths"]["/test"]["get"]["operationId"], "getTest")
+        assert spec["openapi"] == "3.0.0"
+        assert spec["info"]["title"] == "Test API"
+        assert spec["paths"]["/test"]["get"]["operationId"] == "getTest"
 
-    @patch.object(OpenAPIParser, "_fetch_and_parse_with_fallbacks")
-    def test_get_endpoints(self, mock_fetch):
+    def test_get_endpoints(self, json_parser, mock_fetch):
         """Test getting endpoints from the OpenAPI spec."""
-        # Prepare test data with endpoints
-        test_spec = {
-            "openapi": "3.0.0",
-            "info": {"title": "Test API", "version": "1.0.0"},
-            "paths": {
-                "/users": {
-                    "get": {
-                        "operationId": "getUsers",
-                        "parameters": [
-                            {
-                                "name": "limit",
-                                "in": "query",
-                                "schema": {"type": "integer"},
-                            }
-                        ],
-                        "responses": {"200": {"description": "OK"}},
-                    },
-                    "post": {
-                        "operationId": "createUser",
-                        "requestBody": {
-                            "content": {
-                                "application/json": {
-                                    "schema": {"$ref": "#/components/schemas/User"}
-                                }
-                            }
-                        },
-                        "responses": {"201": {"description": "Created"}},
-                    },
-                }
-            },
-        }
-
-        # Configure the mock to return our test data
-        mock_fetch.return_value = test_spec
+        mock_fetch.return_value = ENDPOINTS_SPEC
+        json_parser.fetch_spec()  # This will use the mock
 
-        # Create a new parser instance for this test
-        parser = OpenAPIParser("https://example.com/openapi.json")
-        parser.fetch_spec()  # This will use the mock
-
-        # Get endpoints
-        endpoints = parser.get_endpoints()
+        endpoints = json_parser.get_endpoints()
 
         # Check that the endpoints were extracted correctly
-        self.assertIn("/users", endpoints)
-        self.assertIn("get", endpoints["/users"])
-        self.assertIn("post", endpoints["/users"])
-        self.assertEqual(endpoints["/users"]["get"]["operation_id"], "getUsers")
-        self.assertEqual(endpoints["/users"]["post"]["operation_id"], "createUser")
-        self.assertEqual(len(endpoints["/users"]["get"]["parameters"]), 1)
-        self.assertEqual(endpoints["/users"]["get"]["parameters"][0]["name"], "limit")
-
-    @patch.object(OpenAPIParser, "_fetch_and_parse_with_fallbacks")
-    def test_get_schemas(self, mock_fetch):
+        assert "/users" in endpoints
+        users = endpoints["/users"]
+        assert "get" in users
+        assert "post" in users
+        assert users["get"]["operation_id"] == "getUsers"
+        assert users["post"]["operation_id"] == "createUser"
+        assert len(users["get"]["parameters"]) == 1
+        assert users["get"]["parameters"][0]["name"] == "limit"
+
+    def test_get_schemas(self, json_parser, mock_fetch):
         """Test getting schemas from the OpenAPI spec."""
-        # Prepare test data with schemas
-        test_spec = {
-            "openapi": "3.0.0",
-            "info": {"title": "Test API", "version": "1.0.0"},
-            "paths": {},
-            "components": {
-                "schemas": {
-                    "User": {
-                        "type": "object",
-                        "properties": {
-                            "id": {"type": "integer"},
-                            "name": {"type": "string"},
-                        },
-                    }
-                }
-            },
-        }
-
-        # Configure the mock to return our test data
-        mock_fetch.return_value = test_spec
+        mock_fetch.return_value = SCHEMAS_SPEC
+        json_parser.fetch_spec()  # This will use the mock
 
-        # Create a new parser instance for this test
-        parser = OpenAPIParser("https://example.com/openapi.json")
-        parser.fetch_spec()  # This will use the mock
-
-        # Get schemas
-        schemas = parser.get_schemas()
+        schemas = json_parser.get_schemas()
 
         # Check that the schemas were extracted correctly
-        self.assertIn("User", schemas)
-        self.assertEqual(schemas["User"]["type"], "object")
-        self.assertIn("id", schemas["User"]["properties"])
-        self.assertIn("name", schemas["User"]["properties"])
+        assert "User" in schemas
+        assert schemas["User"]["type"] == "object"
+        assert "id" in schemas["User"]["properties"]
+        assert "name" in schemas["User"]["properties"]
 
-    @patch.object(OpenAPIParser, "_fetch_and_parse_with_fallbacks")
-    def test_get_security_schemes(self, mock_fetch):
+    def test_get_security_schemes(self, json_parser, mock_fetch):
         """Test getting security schemes from the OpenAPI spec."""
-        # Prepare test data with security schemes
-        test_spec = {
-            "openapi": "3.0.0",
-            "info": {"title": "Test API", "version": "1.0.0"},
-            "paths": {},
-            "components": {
-                "securitySchemes": {
-                    "bearerAuth": {
-                        "type": "http",
-                        "scheme": "bearer",
-                        "bearerFormat": "JWT",
-                    }
-                }
-            },
-        }
-
-        # Configure the mock to return our test data
-        mock_fetch.return_value = test_spec
+        mock_fetch.return_value = SECURITY_SPEC
+        json_parser.fetch_spec()  # This will use the mock
 
-        # Create a new parser instance for this test
-        parser = OpenAPIParser("https://example.com/openapi.json")
-        parser.fetch_spec()  # This will use the mock
-
-        # Get security schemes
-        security_schemes = parser.get_security_schemes()
+        security_schemes = json_parser.get_security_schemes()
 
         # Check that the security schemes were extracted correctly
-        self.assertIn("bearerAuth", security_schemes)
-        self.assertEqual(security_schemes["bearerAuth"]["type"], "http")
-        self.assertEqual(security_schemes["bearerAuth"]["scheme"], "bearer")
-        self.assertEqual(security_schemes["bearerAuth"]["bearerFormat"], "JWT")
-
-    def test_clean_spec_content_utf8_bom(self):
+        assert "bearerAuth" in security_schemes
+        bearer = security_schemes["bearerAuth"]
+        assert bearer["type"] == "http"
+        assert bearer["scheme"] == "bearer"
+        assert bearer["bearerFormat"] == "JWT"
+
+    def test_get_endpoints_cached_until_refetch(self, json_parser, mock_fetch):
+        """Test that endpoints are built once per fetched spec."""
+        mock_fetch.return_value = TEST_SPEC
+        json_parser.fetch_spec()
+        endpoints = json_parser.get_endpoints()
+        assert json_parser.get_endpoints() is endpoints
+
+        # Re-fetching a different spec invalidates the cached endpoints
+        mock_fetch.return_value = ENDPOINTS_SPEC
+        json_parser.fetch_spec()
+        assert "/users" in json_parser.get_endpoints()
+        assert "/test" not in json_parser.get_endpoints()
+
+    def test_clean_spec_content_utf8_bom(self, json_parser):
         """Test UTF-8 BOM removal."""
-        parser = OpenAPIParser("dummy_url")
         content_with_bom = '\ufeff{"openapi": "3.0.0"}'
-        cleaned = parser._clean_spec_content(content_with_bom)
-        self.assertFalse(cleaned.startswith("\ufeff"))
-        self.assertTrue(cleaned.startswith("{"))
+        cleaned = json_parser._clean_spec_content(content_with_bom)
+        assert not cleaned.startswith("\ufeff")
+        assert cleaned.startswith("{")
 
-    def test_clean_spec_content_smart_quotes(self):
+    def test_clean_spec_content_smart_quotes(self, json_parser):
         """Test smart quotes replacement."""
-        parser = OpenAPIParser("dummy_url")
         content_with_smart_quotes = "“openapi”: “3.0.0”"
-        cleaned = parser._clean_spec_content(content_with_smart_quotes)
-        self.assertIn('"openapi": "3.0.0"', cleaned)
+        cleaned = json_parser._clean_spec_content(content_with_smart_quotes)
+        assert '"openapi": "3.0.0"' in cleaned
 
-    def test_clean_spec_content_windows_line_endings(self):
+    def test_clean_spec_content_windows_line_endings(self, json_parser):
         """Test CRLF to LF conversion."""
-        parser = OpenAPIParser("dummy_url")
         content_with_crlf = '{\r\n"openapi": "3.0.0"\r\n}'
-        cleaned = parser._clean_spec_content(content_with_crlf)
-        self.assertNotIn("\r\n", cleaned)
-        self.assertIn("\n", cleaned)
+        cleaned = json_parser._clean_spec_content(content_with_crlf)
+        assert "\r\n" not in cleaned
+        assert "\n" in cleaned
 
-    def test_clean_spec_content_non_breaking_spaces(self):
+    def test_clean_spec_content_non_breaking_spaces(self, json_parser):
         """Test non-breaking spaces conversion."""
-        parser = OpenAPIParser("dummy_url")
         content_with_nbsp = '{\u00a0"openapi":\u00a0"3.0.0"\u00a0}'
-        cleaned = parser._clean_spec_content(content_with_nbsp)
-        self.assertNotIn("\u00a0", cleaned)
-        self.assertIn(" ", cleaned)
+        cleaned = json_parser._clean_spec_content(content_with_nbsp)
+        assert "\u00a0" not in cleaned
+        assert " " in cleaned
 
-    def test_clean_spec_content_dash_characters(self):
+    def test_clean_spec_content_dash_characters(self, json_parser):
         """Test en-dash and em-dash conversion."""
-        parser = OpenAPIParser("dummy_url")
         content_with_dashes = '{"desc": "en–dash, em—dash"}'
-        cleaned = parser._clean_spec_content(content_with_dashes)
-        self.assertNotIn("–", cleaned)
-        self.assertNotIn("—", cleaned)
-        self.assertIn("-", cleaned)
+        cleaned = json_parser._clean_spec_content(content_with_dashes)
+        assert "–" not in cleaned
+        assert "—" not in cleaned
+        assert "-" in cleaned
+
+    def test_fix_yaml_structure_missing_space_after_colon(self, json_parser):
+        """Test that a missing space after a mapping colon is inserted."""
+        fixed = json_parser._fix_yaml_structure("  operationId:getUsers")
+        assert fixed == "  operationId: getUsers"
@@ -290,3 +290,18 @@ class TestArazzoValidator(unittest.TestCase):
 
         # Check result
         self.assertTrue(is_valid)
+
+    def test_compiled_validator_is_reused(self):
+        """Test that the compiled validator is reused until the schema changes."""
+        validator = ArazzoValidator()
+        validator.schema = {"type": "object", "required": ["arazzo"]}
+
+        self.assertTrue(validator.validate({"arazzo": "1.0.0"}))
+        compiled = validator._validator
+        self.assertFalse(validator.validate({}))
+        self.assertIs(validator._validator, compiled)
+
+        # Swapping the schema recompiles the validator
+        validator.schema = {"type": "object"}
+        self.assertTrue(validator.validate({}))
+        self.assertIsNot(validator._validator, compiled)
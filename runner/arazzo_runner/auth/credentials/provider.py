@@ -50,19 +50,21 @@ class CredentialProvider:
         logger.debug(f"Fetching credential for {request=}")
         credentials = self.strategy.fetch([request], fetch_options)
 
-        # Validate
-        if not self._are_valid_credentials(credentials):
+        # Validate and transform
+        valid_credentials = self._validate_and_transform(credentials)
+        if valid_credentials is None:
             logger.warning(f"Failed to fetch valid credentials for {request=}")
             # Return empty list instead of exception, this is the old behaviour
             return []
 
-        # Transform
-        credentials = self._transform_credentials(credentials)
-        return credentials
+        return valid_credentials
 
     def get_credentials(
         self, requests: list[SecurityOption], fetch_options: FetchOptions | None = None
     ) -> list[Credential]:
+        # Each option is fetched and validated on its own: its requirements must all be
+        # met (AND), so one invalid credential drops the whole option. A single batched
+        # fetch would return a flat list that can no longer be split back by option.
         credentials = []
         for request in requests:
             credentials.extend(self.get_credential(request, fetch_options))
@@ -77,22 +79,25 @@ class CredentialProvider:
         return [cred.request_auth_value for cred in creds]
 
     ## Private API ##
-    def _are_valid_credentials(self, credentials: list[Credential]) -> bool:
-        """Run all validators on the credentials."""
-        for credential in credentials:
-            for validator in self.validators:
-                if not validator.validate(credential):
-                    return False
-        return True
+    def _validate_and_transform(self, credentials: list[Credential]) -> list[Credential] | None:
+        """Run all validators and then all transformers on each credential in one pass.
+
+        Returns:
+            The transformed credentials, or None as soon as any credential fails validation.
+        """
+        validators = self.validators
+        transformers = self.transformers
+        if not transformers and not validators:
+            return list(credentials)
 
-    def _transform_credentials(self, credentials: list[Credential]) -> list[Credential]:
-        """Apply all transformers to the credentials."""
         results = []
         for credential in credentials:
-            result = credential
-            for transformer in self.transformers:
-                result = transformer.transform(result)
-            results.append(result)
+            for validator in validators:
+                if not validator.validate(credential):
+                    return None
+            for transformer in transformers:
+                credential = transformer.transform(credential)
+            results.append(credential)
         return results
 
     def __str__(self) -> str:
@@ -14,6 +14,26 @@ from .models import ExecutionState
 # Configure logging
 logger = logging.getLogger("arazzo-runner.evaluator")
 
+# Patterns used by handle_array_access
+_STEP_ARRAY_FIELD_RE = re.compile(
+    r"^\$steps\.([a-zA-Z0-9_]+)\.outputs\.([a-zA-Z0-9_]+)\[(\d+)\]\.([a-zA-Z0-9_]+)$"
+)
+_STEP_ARRAY_ITEM_RE = re.compile(r"^\$steps\.([a-zA-Z0-9_]+)\.outputs\.([a-zA-Z0-9_]+)\[(\d+)\]$")
+_INPUT_ARRAY_ITEM_RE = re.compile(r"^\$inputs\.([a-zA-Z0-9_]+)\[(\d+)\]$")
+
+# Patterns used by evaluate_expression
+_JSON_POINTER_EXPRESSION_RE = re.compile(r"^\$([a-zA-Z0-9_]+)\.([a-zA-Z0-9_]+)#(/.*)$")
+_ARRAY_FIELD_ACCESS_RE = re.compile(
+    r"^\$([a-zA-Z0-9_]+)\.([a-zA-Z0-9_]+)\.([a-zA-Z0-9_]+)\.([a-zA-Z0-9_]+)\[(\d+)\]\.([a-zA-Z0-9_]+)$"
+)
+
+# Patterns used by evaluate_simple_condition
+_COMPARISON_RE = re.compile(r"^\s*([^<>=!]+)\s*([<>=!]+)\s*([^<>=!]+)\s*$")
+_CONDITION_EXPRESSION_RE = re.compile(r"\$[a-zA-Z0-9_.]+")
+
+# Template expressions like "prefix-{$inputs.foo}-suffix" in object and array values
+_TEMPLATE_EXPRESSION_RE = re.compile(r"\{(\$[^}]+)\}")
+
 
 class ExpressionEvaluator:
     """Evaluates runtime expressions in Arazzo workflows"""
@@ -29,10 +49,7 @@ class ExpressionEvaluator:
             return None
 
         # Match the common pattern: $steps.{stepId}.outputs.{array}[{index}].{field}
-        match = re.match(
-            r"^\$steps\.([a-zA-Z0-9_]+)\.outputs\.([a-zA-Z0-9_]+)\[(\d+)\]\.([a-zA-Z0-9_]+)$",
-            expression,
-        )
+        match = _STEP_ARRAY_FIELD_RE.match(expression)
         if match:
             step_id, array_name, index_str, field_name = match.groups()
             index = int(index_str)
@@ -81,9 +98,7 @@ class ExpressionEvaluator:
             return value
 
         # Try direct array index access: $steps.{stepId}.outputs.{array}[{index}]
-        match = re.match(
-            r"^\$steps\.([a-zA-Z0-9_]+)\.outputs\.([a-zA-Z0-9_]+)\[(\d+)\]$", expression
-        )
+        match = _STEP_ARRAY_ITEM_RE.match(expression)
         if match:
             step_id, array_name, index_str = match.groups()
             index = int(index_str)
@@ -121,7 +136,7 @@ class ExpressionEvaluator:
             return value
 
         # Try direct input array access: $inputs.{array}[{index}]
-        match = re.match(r"^\$inputs\.([a-zA-Z0-9_]+)\[(\d+)\]$", expression)
+        match = _INPUT_ARRAY_ITEM_RE.match(expression)
         if match:
             array_name, index_str = match.groups()
             index = int(index_str)
@@ -202,7 +217,7 @@ class ExpressionEvaluator:
 
             # Handle JSON Pointer syntax in expressions
             # Check for patterns like $response.body#/path/to/value
-            json_pointer_match = re.match(r"^\$([a-zA-Z0-9_]+)\.([a-zA-Z0-9_]+)#(/.*)$", expression)
+            json_pointer_match = _JSON_POINTER_EXPRESSION_RE.match(expression)
             if json_pointer_match:
                 import jsonpointer
 
@@ -248,8 +263,7 @@ class ExpressionEvaluator:
 
             # For direct access to array elements like $steps.findPetsStep.outputs.availablePets[0].id
             # First check if this is a simple array access pattern we can handle directly
-            array_access_pattern = r"^\$([a-zA-Z0-9_]+)\.([a-zA-Z0-9_]+)\.([a-zA-Z0-9_]+)\.([a-zA-Z0-9_]+)\[(\d+)\]\.([a-zA-Z0-9_]+)$"
-            array_match = re.match(array_access_pattern, expression)
+            array_match = _ARRAY_FIELD_ACCESS_RE.match(expression)
 
             if array_match:
                 # This is a direct array access, let's handle it explicitly
@@ -423,7 +437,7 @@ class ExpressionEvaluator:
             logger.debug(f"Processed condition: {condition}")
 
             # Simple parsing for common comparison patterns
-            left_right_match = re.match(r"^\s*([^<>=!]+)\s*([<>=!]+)\s*([^<>=!]+)\s*$", condition)
+            left_right_match = _COMPARISON_RE.match(condition)
             if left_right_match:
                 left_expr, operator, right_expr = left_right_match.groups()
 
@@ -499,7 +513,7 @@ class ExpressionEvaluator:
                     return repr(value)
 
             # Replace all expressions that start with $
-            condition_with_values = re.sub(r"\$[a-zA-Z0-9_.]+", replace_expr, condition)
+            condition_with_values = _CONDITION_EXPRESSION_RE.sub(replace_expr, condition)
 
             # Replace JavaScript-style syntax with Python syntax
             condition_with_values = condition_with_values.replace("||", " or ").replace(
@@ -551,7 +565,7 @@ class ExpressionEvaluator:
                     )
                     return str(evaluated) if evaluated is not None else ""
 
-                result[key] = re.sub(r"\{(\$[^}]+)\}", replace_expr, value)
+                result[key] = _TEMPLATE_EXPRESSION_RE.sub(replace_expr, value)
             elif isinstance(value, dict):
                 # Process nested dictionary
                 result[key] = ExpressionEvaluator.process_object_expressions(
@@ -590,7 +604,7 @@ class ExpressionEvaluator:
                     )
                     return str(evaluated) if evaluated is not None else ""
 
-                result.append(re.sub(r"\{(\$[^}]+)\}", replace_expr, item))
+                result.append(_TEMPLATE_EXPRESSION_RE.sub(replace_expr, item))
             elif isinstance(item, dict):
                 # Process nested dictionary
                 result.append(
@@ -6,19 +6,35 @@ This module provides functionality to extract input parameters and output schema
 from an OpenAPI specification for a given API operation.
 """
 
-import copy
+import json
 import logging
 import re
+from collections.abc import Mapping
+from itertools import chain, islice
+from types import MappingProxyType
 from typing import Any
 
 import jsonpointer
 
+try:
+    # orjson is an optional, faster serializer for building schema memo keys
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    orjson = None  # type: ignore[assignment]
+
 from arazzo_runner.auth.models import SecurityOption
 from arazzo_runner.executor.operation_finder import OperationFinder
 
 # Configure logging (using the same logger as operation_finder for consistency)
 logger = logging.getLogger("arazzo_runner.extractor")
 
+# Shared read-only default for lookups whose result is only read, so a missing key
+# does not allocate a fresh empty dict
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+# Matches "{name}" templated segments in an operation path
+_PATH_PARAM_RE = re.compile(r"{([^}/]+)}")
+
 
 def _format_security_options_to_dict_list(
     security_options_list: list[SecurityOption],
@@ -79,6 +95,39 @@ def _schema_brief(schema: Any) -> str:
         return "<unprintable schema>"
 
 
+def _json_clone(value: Any) -> Any:
+    """
+    Deep copy a JSON-compatible value.
+
+    Faster than copy.deepcopy for parsed OpenAPI documents, which only contain
+    dicts, lists and immutable scalars: containers are rebuilt and everything else
+    is returned as-is, with no memo table or per-type dispatch.
+    """
+    if isinstance(value, dict):
+        return {k: _json_clone(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_json_clone(v) for v in value]
+    return value
+
+
+def _schema_key(schema_part: Any) -> str | bytes:
+    """
+    Serialize a schema fragment into a canonical, hashable memo key.
+
+    Uses orjson when it is installed and falls back to the standard library for
+    anything orjson refuses.
+
+    Raises:
+        TypeError, ValueError: If the fragment is not JSON-serializable
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(schema_part, option=orjson.OPT_SORT_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(schema_part, sort_keys=True)
+
+
 def _resolve_ref(spec: dict[str, Any], ref: str) -> dict[str, Any]:
     """
     Resolve a single JSON Pointer ``$ref`` to its target object.
@@ -107,7 +156,7 @@ def _resolve_ref(spec: dict[str, Any], ref: str) -> dict[str, Any]:
 
         # Return from cache when available
         if ref in cache:
-            return copy.deepcopy(cache[ref])
+            return _json_clone(cache[ref])
 
         # Detect circular references along the current resolution path
         if ref in stack:
@@ -132,11 +181,12 @@ def _resolve_ref(spec: dict[str, Any], ref: str) -> dict[str, Any]:
                     )
                     result = {}
                 else:
-                    result = copy.deepcopy(resolved_data)
+                    result = _json_clone(resolved_data)
 
-            # Memoize before returning
+            # Memoize before returning; the cache only lives for this call, so the
+            # fresh clone can be handed back without copying it a second time
             cache[ref] = result
-            return copy.deepcopy(result)
+            return result
         except jsonpointer.JsonPointerException as e:
             logger.error(f"Could not resolve reference '{ref}': {e}")
             raise
@@ -224,7 +274,8 @@ def merge_json_schemas(
     if "required" in source and "required" in target:
         source_required = source["required"] if isinstance(source["required"], list) else []
         target_required = target["required"] if isinstance(target["required"], list) else []
-        merged["required"] = list(set(source_required + target_required))
+        # Order-preserving de-duplication, keeping the target's fields first
+        merged["required"] = list(dict.fromkeys(chain(target_required, source_required)))
 
     # Merge properties keyword
     if "properties" in source and "properties" in target:
@@ -330,6 +381,60 @@ def _convert_booleans_to_dict_representation(schema: Any) -> Any:
         return schema
 
 
+# allOf branches made only of these keywords can be folded without the general merger
+_SIMPLE_ALL_OF_KEYS = frozenset(("type", "properties", "required", "description"))
+
+
+def _fold_simple_all_of(all_of_items: list[Any]) -> dict[str, Any] | None:
+    """
+    Fold allOf branches in a single pass when no branch needs the general merger.
+
+    Applies when every branch is a dict using only ``type``, ``properties``,
+    ``required`` and ``description``, the branches agree on ``type`` and no property
+    is declared by more than one branch. The result matches folding the branches
+    with merge_json_schemas: the first ``type``/``description`` wins, properties are
+    combined and ``required`` is de-duplicated.
+
+    Args:
+        all_of_items: The (already folded) allOf branches
+
+    Returns:
+        The merged schema, or None if the general merger has to be used
+    """
+    merged: dict[str, Any] = {}
+    properties: dict[str, Any] = {}
+    required: list[Any] = []
+    has_properties = has_required = False
+    for item in all_of_items:
+        if not isinstance(item, dict) or not _SIMPLE_ALL_OF_KEYS.issuperset(item):
+            return None
+        if "type" in item:
+            if "type" in merged and merged["type"] != item["type"]:
+                return None
+            merged.setdefault("type", item["type"])
+        if "description" in item:
+            merged.setdefault("description", item["description"])
+        if "properties" in item:
+            item_properties = item["properties"]
+            if not isinstance(item_properties, dict) or not properties.keys().isdisjoint(
+                item_properties
+            ):
+                return None
+            properties.update(item_properties)
+            has_properties = True
+        if "required" in item:
+            if not isinstance(item["required"], list):
+                return None
+            required.extend(item["required"])
+            has_required = True
+
+    if has_properties:
+        merged["properties"] = properties
+    if has_required:
+        merged["required"] = list(dict.fromkeys(required))
+    return merged
+
+
 def fold_all_of(schema: Any) -> Any:
     """
     Recursively fold allOf arrays into single schema objects by merging all allOf items.
@@ -359,16 +464,18 @@ def fold_all_of(schema: Any) -> Any:
         if not isinstance(all_of_items, list) or not all_of_items:
             return processed_schema
 
-        # Start with an empty schema
-        merged_schema = {}
+        merged_schema = _fold_simple_all_of(all_of_items)
+        if merged_schema is None:
+            # Start with an empty schema
+            merged_schema = {}
 
-        # Merge all allOf items
-        for item in all_of_items:
-            if isinstance(item, dict):
-                merged_schema = merge_json_schemas(merged_schema, item)
-            elif item is True or item is False:
-                # Handle Boolean JSON Schemas - they take precedence
-                merged_schema = item
+            # Merge all allOf items
+            for item in all_of_items:
+                if isinstance(item, dict):
+                    merged_schema = merge_json_schemas(merged_schema, item)
+                elif item is True or item is False:
+                    # Handle Boolean JSON Schemas - they take precedence
+                    merged_schema = item
 
         # Remove the allOf keyword and merge with any other properties in the original schema
         schema_without_allof = {k: v for k, v in processed_schema.items() if k != "allOf"}
@@ -383,11 +490,36 @@ def fold_all_of(schema: Any) -> Any:
         return schema
 
 
+def _build_ref_index(spec: dict[str, Any]) -> dict[str, Any]:
+    """
+    Map every ``#/components/<section>/<name>`` pointer in the spec to its target.
+
+    Built once per extraction so resolving a component ``$ref`` is a single dict
+    lookup instead of parsing and walking the JSON pointer each time.
+
+    Args:
+        spec: The full OpenAPI specification
+
+    Returns:
+        Dictionary of internal ref strings to the objects they point at
+    """
+    components = spec.get("components")
+    if not isinstance(components, dict):
+        return {}
+    return {
+        f"#/components/{section}/{name.replace('~', '~0').replace('/', '~1')}": node
+        for section, entries in components.items()
+        if isinstance(entries, dict)
+        for name, node in entries.items()
+    }
+
+
 def _resolve_schema_refs(
     schema_part: Any,
     full_spec: dict[str, Any],
     visited_refs: set[str] | None = None,
     cache: dict[str, Any] | None = None,
+    ref_index: dict[str, Any] | None = None,
 ) -> Any:
     """
     Resolve schema references without sibling merging.
@@ -399,64 +531,114 @@ def _resolve_schema_refs(
     Handles Boolean JSON Schemas (True/False) as identity functions for OpenAPI 3.1.x
     compatibility, where schemas can be represented as boolean values.
 
+    Only references whose resolution never reached a cycle placeholder are stored in
+    ``cache``; those results do not depend on the refs being resolved around them, so
+    the same cache can be shared across calls against the same spec. Resolved
+    subtrees are shared between the cache and the returned schema and must be
+    treated as read-only.
+
     Args:
         schema_part: The schema fragment to resolve
         full_spec: The full OpenAPI specification
         visited_refs: Set of visited references for cycle detection
         cache: Memoization cache for resolved references
+        ref_index: Optional index from _build_ref_index; refs missing from it are
+            resolved as JSON pointers against full_spec
 
     Returns:
         The schema with references resolved but siblings not merged
     """
     stack = visited_refs if visited_refs is not None else set()
     memo = cache if cache is not None else {}
-
-    # Handle Boolean JSON Schemas (OpenAPI 3.1.x compatibility)
-    if schema_part is True or schema_part is False:
-        return schema_part
-
-    # Primitives pass through
-    if not isinstance(schema_part, dict | list):
-        return schema_part
-
-    if isinstance(schema_part, dict):
-        if "$ref" in schema_part:
-            ref = schema_part["$ref"]
-            if ref in memo:
-                result = memo[ref]
-            else:
+    index = ref_index if ref_index is not None else {}
+    # Results that stop at a cycle placeholder are only valid for this call
+    cyclic_memo: dict[str, Any] = {}
+    # Number of cycle placeholders emitted so far; unchanged across a ref's
+    # resolution means the result is independent of the enclosing refs
+    cycle_cuts = [0]
+
+    def _resolve(part: Any) -> Any:
+        # Handle Boolean JSON Schemas (OpenAPI 3.1.x compatibility)
+        if part is True or part is False:
+            return part
+
+        # Primitives pass through
+        if not isinstance(part, dict | list):
+            return part
+
+        if isinstance(part, dict):
+            if "$ref" in part:
+                ref = part["$ref"]
+                if ref in memo:
+                    return memo[ref]
+                if ref in cyclic_memo:
+                    cycle_cuts[0] += 1
+                    return cyclic_memo[ref]
                 if ref in stack:
                     logger.debug(
                         f"Circular reference detected for '{ref}'. Returning $ref placeholder."
                     )
+                    cycle_cuts[0] += 1
                     return {"$ref": ref}
                 stack.add(ref)
                 try:
-                    target = jsonpointer.resolve_pointer(full_spec, ref[1:])
+                    target = index.get(ref)
+                    if target is None:
+                        target = jsonpointer.resolve_pointer(full_spec, ref[1:])
                     if not isinstance(target, dict | list):
                         logger.warning(
                             f"Resolved $ref '{ref}' is not a dict/list. Returning empty dict."
                         )
                         result = {}
                     else:
-                        # Provisional entry breaks indirect cycles
-                        memo[ref] = {"$ref": ref}
-                        result = _resolve_schema_refs(target, full_spec, stack, memo)
-                        memo[ref] = result
+                        cuts_before = cycle_cuts[0]
+                        result = _resolve(target)
+                        if cycle_cuts[0] == cuts_before:
+                            memo[ref] = result
+                        else:
+                            cyclic_memo[ref] = result
                 except (jsonpointer.JsonPointerException, ValueError, KeyError) as e:
                     logger.warning(f"Could not resolve nested $ref '{ref}': {e}")
                     result = {"$ref": ref}
                 finally:
                     stack.discard(ref)
 
-            # Return the resolved result without merging siblings
-            return result
-
-        # Regular dict: resolve entries
-        return {k: _resolve_schema_refs(v, full_spec, stack, memo) for k, v in schema_part.items()}
-
-    # List: resolve items
-    return [_resolve_schema_refs(item, full_spec, stack, memo) for item in schema_part]
+                # Return the resolved result without merging siblings
+                return result
+
+            # Regular dict: resolve entries. Subtrees without any $ref come back as the
+            # original object, and a new dict is only built once an entry actually changes.
+            resolved_dict = None
+            for position, (k, v) in enumerate(part.items()):
+                if not isinstance(v, dict | list):
+                    # Scalars resolve to themselves; skip the call
+                    if resolved_dict is not None:
+                        resolved_dict[k] = v
+                    continue
+                resolved_value = _resolve(v)
+                if resolved_dict is None:
+                    if resolved_value is v:
+                        continue
+                    resolved_dict = dict(islice(part.items(), position))
+                resolved_dict[k] = resolved_value
+            return part if resolved_dict is None else resolved_dict
+
+        # List: resolve items, again only copying once an item changes
+        resolved_list = None
+        for position, item in enumerate(part):
+            if not isinstance(item, dict | list):
+                if resolved_list is not None:
+                    resolved_list.append(item)
+                continue
+            resolved_item = _resolve(item)
+            if resolved_list is None:
+                if resolved_item is item:
+                    continue
+                resolved_list = part[:position]
+            resolved_list.append(resolved_item)
+        return part if resolved_list is None else resolved_list
+
+    return _resolve(schema_part)
 
 
 def merge_siblings(schema: Any, original_schema: Any) -> Any:
@@ -495,6 +677,7 @@ def resolve_schema(
     full_spec: dict[str, Any],
     visited_refs: set[str] | None = None,
     cache: dict[str, Any] | None = None,
+    ref_index: dict[str, Any] | None = None,
 ) -> Any:
     """
     Three-pass schema resolution with OpenAPI 3.0.x and 3.1.x compatibility:
@@ -516,12 +699,13 @@ def resolve_schema(
         full_spec: The full OpenAPI specification
         visited_refs: Set of visited references for cycle detection
         cache: Memoization cache for resolved references
+        ref_index: Optional component ref index from _build_ref_index
 
     Returns:
         The fully resolved schema with all transformations applied
     """
     # Pass 1: Reference resolution with cycle elimination (without sibling merging)
-    resolved_schema = _resolve_schema_refs(schema_part, full_spec, visited_refs, cache)
+    resolved_schema = _resolve_schema_refs(schema_part, full_spec, visited_refs, cache, ref_index)
 
     # Pass 2: Sibling merging
     merged_schema = merge_siblings(resolved_schema, schema_part)
@@ -631,7 +815,7 @@ def extract_operation_io(
     """
     # Find the operation first using OperationFinder
     # Wrap the spec for OperationFinder
-    source_name = spec.get("info", {}).get("title", "default_spec")
+    source_name = spec.get("info", _EMPTY_MAPPING).get("title", "default_spec")
     source_descriptions = {source_name: spec}
     finder = OperationFinder(source_descriptions)
     operation_info = finder.find_by_http_path_and_method(http_path, http_method.lower())
@@ -661,8 +845,33 @@ def extract_operation_io(
         security_options_list, operation_info
     )
 
+    # Component lookups and resolved $ref targets shared by every schema resolved
+    # for this operation
+    ref_index = _build_ref_index(spec)
+    schema_cache: dict[str, Any] = {}
+    # Fully resolved schemas keyed by the serialized input fragment, so fragments that
+    # repeat within the operation (e.g. several parameters using the same $ref) are
+    # only resolved, sibling-merged and allOf-folded once
+    resolved_schemas: dict[str | bytes, Any] = {}
+
+    def _resolve_memoized(schema_part: Any) -> Any:
+        try:
+            key = _schema_key(schema_part)
+        except (TypeError, ValueError):
+            return resolve_schema(schema_part, spec, cache=schema_cache, ref_index=ref_index)
+        if key in resolved_schemas:
+            # Repeat uses get their own copy so the extracted details never share objects
+            return _json_clone(resolved_schemas[key])
+        resolved = resolve_schema(schema_part, spec, cache=schema_cache, ref_index=ref_index)
+        # Keep a private copy, as callers may edit the schema they get back (e.g. when
+        # flattening oneOf/anyOf request bodies)
+        resolved_schemas[key] = _json_clone(resolved)
+        return resolved
+
     all_parameters = []
-    seen_params = set()
+    # Position of each (name, in) pair in all_parameters, so operation-level overrides
+    # replace path-level entries without rescanning the list
+    param_index: dict[tuple[Any, Any], int] = {}
 
     # Check for path-level parameters first
     path_item_ref = f"#/paths/{operation_info.get('path', '').lstrip('/')}"
@@ -679,9 +888,9 @@ def extract_operation_io(
                     if "$ref" in param:
                         resolved_param = _resolve_ref(spec, param["$ref"])
                     param_key = (resolved_param.get("name"), resolved_param.get("in"))
-                    if param_key not in seen_params:
+                    if param_key not in param_index:
+                        param_index[param_key] = len(all_parameters)
                         all_parameters.append(resolved_param)
-                        seen_params.add(param_key)
                 except (jsonpointer.JsonPointerException, ValueError, KeyError) as e:
                     logger.warning(
                         f"Skipping path-level parameter due to resolution/format error: {e}"
@@ -697,19 +906,12 @@ def extract_operation_io(
                 if "$ref" in param:
                     resolved_param = _resolve_ref(spec, param["$ref"])
                 param_key = (resolved_param.get("name"), resolved_param.get("in"))
-                existing_index = next(
-                    (
-                        i
-                        for i, p in enumerate(all_parameters)
-                        if (p.get("name"), p.get("in")) == param_key
-                    ),
-                    None,
-                )
+                existing_index = param_index.get(param_key)
                 if existing_index is not None:
                     all_parameters[existing_index] = resolved_param
-                elif param_key not in seen_params:
+                else:
+                    param_index[param_key] = len(all_parameters)
                     all_parameters.append(resolved_param)
-                    seen_params.add(param_key)
             except (jsonpointer.JsonPointerException, ValueError, KeyError) as e:
                 logger.warning(
                     f"Skipping operation-level parameter due to resolution/format error: {e}"
@@ -717,17 +919,21 @@ def extract_operation_io(
 
     # --- Ensure all URL path parameters are present and required ---
     # Find all {param} in the http_path
-    url_param_names = re.findall(r"{([^}/]+)}", http_path)
+    url_param_names = _PATH_PARAM_RE.findall(http_path)
     for url_param in url_param_names:
         param_key = (url_param, "path")
-        if param_key not in seen_params:
+        if param_key not in param_index:
+            param_index[param_key] = len(all_parameters)
             all_parameters.append(
                 {"name": url_param, "in": "path", "required": True, "schema": {"type": "string"}}
             )
-            seen_params.add(param_key)
     # --- End ensure URL params ---
 
-    # Process collected parameters into simplified inputs
+    # Process collected parameters into simplified inputs, tracking the required names
+    # in a set alongside the ordered list so membership checks stay constant-time
+    input_properties = extracted_details["inputs"]["properties"]
+    input_required = extracted_details["inputs"]["required"]
+    required_seen: set[str] = set()
     for param in all_parameters:
         param_name = param.get("name")
         param_in = param.get("in")
@@ -742,7 +948,7 @@ def extract_operation_io(
                 if isinstance(param_schema, dict) and "$ref" in param_schema:
                     # Defer full resolution to resolve_schema to properly handle cycles, siblings, and allOf
                     try:
-                        param_schema = resolve_schema(param_schema, spec)
+                        param_schema = _resolve_memoized(param_schema)
                     except Exception as ref_e:
                         logger.warning(
                             f"Could not resolve schema $ref for parameter '{param_name}': {ref_e}"
@@ -771,11 +977,12 @@ def extract_operation_io(
             param_description = param.get("description")
             if param_description:
                 param_input["description"] = param_description
-            extracted_details["inputs"]["properties"][param_name] = param_input
+            input_properties[param_name] = param_input
             if is_required:
                 # Add to top-level required list if not already present
-                if param_name not in extracted_details["inputs"]["required"]:
-                    extracted_details["inputs"]["required"].append(param_name)
+                if param_name not in required_seen:
+                    required_seen.add(param_name)
+                    input_required.append(param_name)
 
     # Process Request Body for inputs
     if "requestBody" in operation:
@@ -784,7 +991,7 @@ def extract_operation_io(
             if "$ref" in request_body:
                 # Resolve requestBody schema using three-pass resolver with cycles, siblings, and allOf.
                 try:
-                    request_body = resolve_schema(request_body, spec)
+                    request_body = _resolve_memoized(request_body)
                 except Exception as e:
                     # Continue with execution even if schema could not be fully resolved
                     logger.warning(f"Could not resolve requestBody: {e}")
@@ -798,13 +1005,13 @@ def extract_operation_io(
                 # Let the recursive resolver handle any $ref and cycles
 
                 # Recursively resolve nested refs within the body schema with three-pass resolution
-                fully_resolved_body_schema = resolve_schema(body_schema, spec)
+                fully_resolved_body_schema = _resolve_memoized(body_schema)
                 # --- Flatten body properties into inputs ---
                 if (
                     isinstance(fully_resolved_body_schema, dict)
                     and fully_resolved_body_schema.get("type") == "object"
                 ):
-                    body_properties = fully_resolved_body_schema.get("properties", {})
+                    body_properties = fully_resolved_body_schema.get("properties", _EMPTY_MAPPING)
                     for prop_name, prop_schema in body_properties.items():
                         if prop_name in extracted_details["inputs"]["properties"]:
                             # Handle potential name collisions (e.g., param 'id' and body field 'id')
@@ -815,10 +1022,11 @@ def extract_operation_io(
                         extracted_details["inputs"]["properties"][prop_name] = prop_schema
 
                     # Add required body properties to the main 'required' list
-                    body_required = fully_resolved_body_schema.get("required", [])
+                    body_required = fully_resolved_body_schema.get("required", ())
                     for req_prop_name in body_required:
-                        if req_prop_name not in extracted_details["inputs"]["required"]:
-                            extracted_details["inputs"]["required"].append(req_prop_name)
+                        if req_prop_name not in required_seen:
+                            required_seen.add(req_prop_name)
+                            input_required.append(req_prop_name)
                 elif isinstance(fully_resolved_body_schema, dict) and (
                     any(
                         structure_type in fully_resolved_body_schema
@@ -851,7 +1059,7 @@ def extract_operation_io(
                                 if "properties" in merged_option:
                                     # Create a flat dict with all properties
                                     flat_properties = {}
-                                    required_fields = set(merged_option.get("required", []))
+                                    required_fields = set(merged_option.get("required", ()))
 
                                     for prop_name, prop_schema in merged_option[
                                         "properties"
@@ -883,7 +1091,7 @@ def extract_operation_io(
 
     # Process 200 or 201 Response for outputs
     if "responses" in operation:
-        responses = operation.get("responses", {})
+        responses = operation["responses"]
         # Prioritize 200, fallback to 201 for success output schema
         success_response = responses.get("200") or responses.get("201")
         if success_response:
@@ -891,7 +1099,7 @@ def extract_operation_io(
                 resolved_response = success_response
                 if isinstance(success_response, dict) and "$ref" in success_response:
                     # Resolve response object safely with three-pass schema resolver
-                    resolved_response = resolve_schema(success_response, spec)
+                    resolved_response = _resolve_memoized(success_response)
 
                 # Check for application/json or application/x-www-form-urlencoded content in the resolved successful response
                 response_content = resolved_response.get("content", {})
@@ -903,7 +1111,7 @@ def extract_operation_io(
                     logger.debug(
                         f"Output schema BEFORE recursive resolve: {_schema_brief(response_schema)}"
                     )
-                    fully_resolved_output_schema = resolve_schema(response_schema, spec)
+                    fully_resolved_output_schema = _resolve_memoized(response_schema)
                     logger.debug(
                         f"Output schema AFTER recursive resolve: {_schema_brief(fully_resolved_output_schema)}"
                     )
@@ -933,30 +1141,42 @@ def extract_operation_io(
 def _limit_dict_depth(
     data: dict | list | Any, max_depth: int, current_depth: int = 0
 ) -> dict | list | Any:
-    """Recursively limits the depth of a dictionary or list structure."""
+    """Limits the depth of a dictionary or list structure.
 
-    if isinstance(data, dict):
-        if current_depth >= max_depth:
-            return data.get("type", "object")  # Limit hit for dict
-        else:
-            # Recurse into dict
-            limited_dict = {}
-            for key, value in data.items():
+    Walks the structure with an explicit stack rather than recursion. The input is
+    never modified; limited copies of each container are built instead.
+    """
+    # Each frame is (value, parent container, key in parent, depth of value)
+    root: list[Any] = [None]
+    stack = [(data, root, 0, current_depth)]
+    while stack:
+        value, parent, key, depth = stack.pop()
+        if isinstance(value, dict):
+            if depth >= max_depth:
+                parent[key] = value.get("type", "object")  # Limit hit for dict
+                continue
+            limited_dict: dict[str, Any] = {}
+            parent[key] = limited_dict
+            for child_key, child in value.items():
                 # Special case to preserve enum lists
-                if key == "enum" and isinstance(value, list):
-                    limited_dict[key] = value
+                if child_key == "enum" and isinstance(child, list):
+                    limited_dict[child_key] = child
+                elif isinstance(child, dict | list):
+                    # Reserve the key now so the original key order is kept
+                    limited_dict[child_key] = None
+                    stack.append((child, limited_dict, child_key, depth + 1))
                 else:
-                    limited_dict[key] = _limit_dict_depth(value, max_depth, current_depth + 1)
-            return limited_dict
-    elif isinstance(data, list):
-        if current_depth >= max_depth:
-            return "array"  # Limit hit for list
+                    limited_dict[child_key] = child
+        elif isinstance(value, list):
+            if depth >= max_depth:
+                parent[key] = "array"  # Limit hit for list
+                continue
+            limited_list = list(value)
+            parent[key] = limited_list
+            for index, item in enumerate(value):
+                if isinstance(item, dict | list):
+                    stack.append((item, limited_list, index, depth + 1))
         else:
-            # Recurse into list
-            limited_list = []
-            for item in data:
-                limited_list.append(_limit_dict_depth(item, max_depth, current_depth + 1))
-            return limited_list
-    else:
-        # It's a primitive, return the value itself regardless of depth
-        return data
+            # It's a primitive, keep the value itself regardless of depth
+            parent[key] = value
+    return root[0]
@@ -9,17 +9,66 @@ import logging
 import os
 import re
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
 from typing import Any
 
 import jsonpointer
+import requests
 import yaml
 
+try:
+    # orjson is an optional, faster drop-in for decoding large JSON specs
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    orjson = None  # type: ignore[assignment]
+
+try:
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as YAMLSafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as YAMLSafeLoader  # type: ignore[assignment, unused-ignore]
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger("arazzo-runner")
 
+# Patterns used by extract_json_pointer_from_expression
+_POINTER_EXPRESSION_RE = re.compile(r"^\$([a-zA-Z0-9_.]+)#(/.*)")
+_DOT_PATH_EXPRESSION_RE = re.compile(r"^\$([a-zA-Z0-9_]+)\.([a-zA-Z0-9_.]+)")
+_PROPERTY_POINTER_EXPRESSION_RE = re.compile(r"^\$([a-zA-Z0-9_.]+)\.([a-zA-Z0-9_]+)#(/.*)")
+
+# Upper bound on concurrent remote source description fetches
+_MAX_SOURCE_FETCH_WORKERS = 8
+
+# Patterns used by sanitize_for_env_var
+_ENV_VAR_INVALID_CHARS_RE = re.compile(r"[^a-zA-Z0-9_]")
+_ENV_VAR_UNDERSCORE_RUN_RE = re.compile(r"_+")
+
+
+def _json_loads(content: str | bytes) -> Any:
+    """
+    Decode a JSON document, using orjson when it is installed.
+
+    orjson is stricter than the standard library (e.g. it rejects NaN and Infinity),
+    so anything it refuses is handed to json.loads, which either accepts it or
+    raises the usual json.JSONDecodeError.
+
+    Args:
+        content: The JSON document as text or UTF-8 bytes
+
+    Returns:
+        The decoded document
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
 
 def load_arazzo_doc(arazzo_path: str) -> dict:
     """
@@ -31,30 +80,50 @@ def load_arazzo_doc(arazzo_path: str) -> dict:
     Returns:
         arazzo_doc: Parsed Arazzo document
     """
-    with open(arazzo_path) as f:
+    # Read raw bytes; both parsers decode UTF-8 themselves, so there is no
+    # separate decode-to-str pass over the whole document
+    with open(arazzo_path, "rb") as f:
         content = f.read()
-        if arazzo_path.endswith((".yaml", ".yml")):
-            return yaml.safe_load(content)
-        else:
-            return json.loads(content)
+    if arazzo_path.endswith((".yaml", ".yml")):
+        return yaml.load(content, Loader=YAMLSafeLoader)
+    else:
+        return _json_loads(content)
 
 
 def load_source_descriptions(
-    arazzo_doc: dict, arazzo_path: str, base_path: str, http_client
+    arazzo_doc: dict, arazzo_path: str, base_path: str, http_client: requests.Session | None
 ) -> dict[str, Any]:
     """
     Load referenced OpenAPI descriptions
 
+    Remote sources are fetched concurrently, so the http_client is called from
+    several worker threads at once and must be safe to share between them.
+
     Args:
         arazzo_doc: Parsed Arazzo document
         base_path: Base path for resolving relative paths
-        http_client: HTTP client to use for loading remote sources
+        http_client: HTTP client to use for loading remote sources (defaults to a
+            requests.Session that is shared by all remote fetches and closed afterwards)
 
     Returns:
         source_descriptions: Dictionary of loaded source descriptions
     """
     source_descriptions = {}
     source_descriptions_list = arazzo_doc.get("sourceDescriptions", [])
+    source_order = []
+    remote_sources = []
+    # Parsed local files by absolute path, so sources sharing a file parse it once
+    local_sources: dict[str, Any] = {}
+
+    # Base directories for resolving local files are the same for every source
+    arazzo_dir = os.path.dirname(os.path.abspath(arazzo_path)) if arazzo_path else None
+    current_path = os.path.abspath(os.getcwd())
+    # If current path contains '/tools/arazzo-runner', also try the directory up 2 levels
+    base_path_2up = (
+        os.path.abspath(os.path.join(current_path, "../.."))
+        if "/tools/arazzo-runner" in current_path
+        else None
+    )
 
     for source in source_descriptions_list:
         source_name = source.get("name")
@@ -62,6 +131,7 @@ def load_source_descriptions(
 
         if not source_name or not source_url:
             continue
+        source_order.append(source_name)
 
         # Handle local file references
         if not (source_url.startswith("http://") or source_url.startswith("https://")):
@@ -71,50 +141,129 @@ def load_source_descriptions(
             if base_path:
                 candidate_paths.append(os.path.join(base_path, source_url))
             # 2. Try using a path relative to the arazzo_path if available
-            if arazzo_path:
-                arazzo_dir = os.path.dirname(os.path.abspath(arazzo_path))
+            if arazzo_dir:
                 candidate_paths.append(os.path.join(arazzo_dir, source_url))
             # 3. Try using a path relative to the current path
-            current_path = os.path.abspath(os.getcwd())
             candidate_paths.append(os.path.join(current_path, source_url))
-            # 4. If current path contains '/tools/arazzo-runner', set base_path up 2 levels
-            if "/tools/arazzo-runner" in current_path:
-                base_path_2up = os.path.abspath(os.path.join(current_path, "../.."))
+            # 4. If current path contains '/tools/arazzo-runner', use the base path up 2 levels
+            if base_path_2up:
                 candidate_paths.append(os.path.join(base_path_2up, source_url))
             # Try each candidate path
             source_path = None
             for path in candidate_paths:
-                if os.path.exists(path):
-                    source_path = path
-                    break
+                try:
+                    os.stat(path)
+                except (OSError, ValueError):
+                    continue
+                source_path = path
+                break
             if not source_path:
                 raise FileNotFoundError(
                     f"Could not find source file for {source_name} using any known base path candidates: {candidate_paths}"
                 )
             try:
-                with open(source_path) as f:
-                    content = f.read()
-                    if source_path.endswith((".yaml", ".yml")):
-                        source_descriptions[source_name] = yaml.safe_load(content)
-                    else:
-                        source_descriptions[source_name] = json.loads(content)
+                abs_path = os.path.abspath(source_path)
+                if abs_path not in local_sources:
+                    local_sources[abs_path] = _load_local_source(abs_path)
+                source_descriptions[source_name] = local_sources[abs_path]
             except (FileNotFoundError, json.JSONDecodeError, yaml.YAMLError) as e:
                 logger.error(f"Error loading source description {source_name}: {e}")
         else:
-            # Handle remote URLs
-            try:
-                response = http_client.get(source_url)
-                response.raise_for_status()
-                content_type = response.headers.get("Content-Type", "")
+            # Remote sources are fetched together once all local ones are loaded
+            remote_sources.append((source_name, source_url))
+
+    if remote_sources:
+        # Sources that alias the same URL are fetched and parsed only once
+        url_to_names: dict[str, list[str]] = {}
+        for source_name, source_url in remote_sources:
+            url_to_names.setdefault(source_url, []).append(source_name)
+        unique_sources = [(names[0], url) for url, names in url_to_names.items()]
+
+        if http_client is None:
+            # Share one pooled session across every remote fetch
+            with requests.Session() as session:
+                fetched = _fetch_remote_sources(session, unique_sources)
+        else:
+            fetched = _fetch_remote_sources(http_client, unique_sources)
+        for source_url, description in zip(url_to_names, fetched, strict=True):
+            if description is not None:
+                for source_name in url_to_names[source_url]:
+                    source_descriptions[source_name] = description
 
-                if "yaml" in content_type or "yml" in content_type:
-                    source_descriptions[source_name] = yaml.safe_load(response.text)
-                else:
-                    source_descriptions[source_name] = response.json()
-            except Exception as e:
-                logger.error(f"Error loading remote source description {source_name}: {e}")
+    # Keep the order the sources were declared in, whichever way they were loaded
+    return {name: source_descriptions[name] for name in source_order if name in source_descriptions}
 
-    return source_descriptions
+
+def _load_local_source(source_path: str) -> Any:
+    """
+    Load and parse a local source description
+
+    Args:
+        source_path: Path to the source description file
+
+    Returns:
+        The parsed source description
+    """
+    with open(source_path, "rb") as f:
+        content = f.read()
+    if source_path.endswith((".yaml", ".yml")):
+        return yaml.load(content, Loader=YAMLSafeLoader)
+    return _json_loads(content)
+
+
+def _fetch_remote_sources(
+    http_client: requests.Session, sources: list[tuple[str, str]]
+) -> list[Any | None]:
+    """
+    Fetch remote source descriptions, overlapping their network round-trips
+
+    Args:
+        http_client: HTTP client to fetch the sources with, shared by the worker threads
+        sources: (source name, source URL) pairs to fetch
+
+    Returns:
+        The parsed source descriptions in the order of sources, with None for any
+        that could not be loaded
+    """
+    if len(sources) == 1:
+        return [_fetch_remote_source(http_client, *sources[0])]
+    workers = min(_MAX_SOURCE_FETCH_WORKERS, len(sources))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(lambda remote: _fetch_remote_source(http_client, *remote), sources)
+        )
+
+
+def _fetch_remote_source(
+    http_client: requests.Session, source_name: str, source_url: str
+) -> Any | None:
+    """
+    Fetch and parse a remote source description
+
+    Args:
+        http_client: HTTP client to fetch the source with
+        source_name: Name of the source description, used for logging
+        source_url: URL of the source description
+
+    Returns:
+        The parsed source description, or None if it could not be loaded
+    """
+    try:
+        response = http_client.get(source_url)
+        response.raise_for_status()
+        content_type = response.headers.get("Content-Type", "").lower()
+
+        # Parse the raw body bytes directly rather than decoding to text first
+        if (
+            "yaml" in content_type
+            or "yml" in content_type
+            or source_url.endswith((".yaml", ".yml"))
+        ):
+            return yaml.load(response.content, Loader=YAMLSafeLoader)
+        return _json_loads(response.content)
+    except Exception as e:
+        logger.error(f"Error loading remote source description {source_name}: {e}")
+        return None
 
 
 def dump_state(state, label: str = "Current Execution State"):
@@ -125,6 +274,10 @@ def dump_state(state, label: str = "Current Execution State"):
         state: Execution state to dump
         label: Optional label for the state dump
     """
+    # Skip formatting the (potentially large) state when it would not be logged
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
     logger.debug(f"=== {label} ===")
     logger.debug(f"Workflow ID: {state.workflow_id}")
     logger.debug(f"Current Step ID: {state.current_step_id}")
@@ -136,6 +289,12 @@ def dump_state(state, label: str = "Current Execution State"):
     logger.debug(f"Status: {state.status}")
 
 
+@lru_cache(maxsize=2048)
+def _compile_json_pointer(pointer_path: str) -> jsonpointer.JsonPointer:
+    """Parse a JSON pointer once and reuse it for repeated evaluations of the same path."""
+    return jsonpointer.JsonPointer(pointer_path)
+
+
 def evaluate_json_pointer(data: dict, pointer_path: str) -> Any | None:
     """
     Evaluate a JSON pointer against the provided data.
@@ -155,8 +314,8 @@ def evaluate_json_pointer(data: dict, pointer_path: str) -> Any | None:
         if pointer_path == "/":
             return data
 
-        # Create a JSON pointer resolver
-        pointer = jsonpointer.JsonPointer(pointer_path)
+        # Get the (cached) JSON pointer resolver
+        pointer = _compile_json_pointer(pointer_path)
         result = pointer.resolve(data)
         return result
     except (jsonpointer.JsonPointerException, TypeError) as e:
@@ -178,14 +337,14 @@ def extract_json_pointer_from_expression(expression: str) -> tuple[str | None, s
         return (None, None)
 
     # Handle the form $response.body#/path/to/value
-    match = re.match(r"^\$([a-zA-Z0-9_.]+)#(/.*)", expression)
+    match = _POINTER_EXPRESSION_RE.match(expression)
     if match:
         container_path, pointer_path = match.groups()
         return (container_path, pointer_path)
 
     # Handle expressions like $response.body.path.to.value by converting to JSON pointer
     # This supports workflows that don't explicitly use # JSON pointer syntax
-    match = re.match(r"^\$([a-zA-Z0-9_]+)\.([a-zA-Z0-9_.]+)", expression)
+    match = _DOT_PATH_EXPRESSION_RE.match(expression)
     if match and "#" not in expression:
         container, path = match.groups()
         # Convert dot notation to JSON pointer format
@@ -193,7 +352,7 @@ def extract_json_pointer_from_expression(expression: str) -> tuple[str | None, s
         return (container, pointer_path)
 
     # Handle the standard form $response.body#/path
-    match = re.match(r"^\$([a-zA-Z0-9_.]+)\.([a-zA-Z0-9_]+)#(/.*)", expression)
+    match = _PROPERTY_POINTER_EXPRESSION_RE.match(expression)
     if match:
         container, property_name, pointer_path = match.groups()
         return (f"{container}.{property_name}", pointer_path)
@@ -220,15 +379,15 @@ def load_openapi_file(openapi_path: str) -> dict[str, Any]:
         if not os.path.isfile(openapi_path):
             raise FileNotFoundError(f"OpenAPI file not found: {openapi_path}")
 
-        with open(openapi_path) as f:
+        with open(openapi_path, "rb") as f:
             content = f.read()
 
         # Try parsing as YAML, then JSON
         try:
-            return yaml.safe_load(content)
+            return yaml.load(content, Loader=YAMLSafeLoader)
         except yaml.YAMLError:
             try:
-                return json.loads(content)
+                return _json_loads(content)
             except json.JSONDecodeError as json_err:
                 logger.error(
                     f"Failed to parse OpenAPI spec as YAML or JSON from {openapi_path}: {json_err}"
@@ -263,10 +422,14 @@ def set_log_level(level: str):
     logging.getLogger("arazzo-runner.http").setLevel(numeric_level)
 
 
+@lru_cache(maxsize=4096)
 def sanitize_for_env_var(text: str) -> str:
     """
     Sanitize a string for use in environment variable names.
 
+    Results are memoized, since the same names are sanitized for every step and
+    credential lookup.
+
     Args:
         text: The text to sanitize
 
@@ -280,10 +443,10 @@ def sanitize_for_env_var(text: str) -> str:
     sanitized = sanitized.replace("-", "_")
 
     # Replace other non-alphanumeric characters with underscores
-    sanitized = re.sub(r"[^a-zA-Z0-9_]", "_", sanitized)
+    sanitized = _ENV_VAR_INVALID_CHARS_RE.sub("_", sanitized)
 
     # Replace multiple consecutive underscores with a single underscore
-    sanitized = re.sub(r"_+", "_", sanitized)
+    sanitized = _ENV_VAR_UNDERSCORE_RUN_RE.sub("_", sanitized)
 
     # Remove leading and trailing underscores
     sanitized = sanitized.strip("_")
@@ -322,6 +485,7 @@ def extract_api_title_prefix(title: str) -> str | None:
     return words[0]
 
 
+@lru_cache(maxsize=4096)
 def create_env_var_name(var_name: str, prefix: str | None = None) -> str:
     """
     Create a standardized environment variable name with an optional prefix.
@@ -361,6 +525,7 @@ def deprecated(reason: str):
     """
 
     def decorator(func):
+        @wraps(func)
         def wrapper(*args, **kwargs):
             warnings.warn(
                 f"{func.__name__} is deprecated: {reason}", DeprecationWarning, stacklevel=2
@@ -1,11 +1,11 @@
 import base64
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, call
 
 import pytest
 
 from arazzo_runner.auth.credentials.fetch import FetchOptions
 from arazzo_runner.auth.credentials.models import Credential
-from arazzo_runner.auth.credentials.provider import CredentialProviderFactory
+from arazzo_runner.auth.credentials.provider import CredentialProvider, CredentialProviderFactory
 from arazzo_runner.auth.models import (
     AuthLocation,
     EnvVarKeys,
@@ -220,6 +220,129 @@ def test_resolve_credentials_multiple_options(
     assert result[1].request_auth_value.auth_value == "Bearer test-bearer-token-value"
 
 
+def test_get_credentials_fetches_each_option_once(
+    env_mappings, api_key_req, bearer_req, monkeypatch
+):
+    """Test that each option is fetched with a single strategy.fetch call."""
+    monkeypatch.setenv("TEST_API_KEY", "test-api-key-value")
+    monkeypatch.setenv("TEST_BEARER_TOKEN", "test-bearer-token-value")
+
+    provider = CredentialProviderFactory.create_default(
+        env_mapping=env_mappings,
+        http_client=MagicMock(),
+        auth_requirements=[api_key_req, bearer_req],
+    )
+    api_key_option = SecurityOption(
+        requirements=[SecurityRequirement(scheme_name="ApiKeyAuth", scopes=[])]
+    )
+    bearer_option = SecurityOption(
+        requirements=[SecurityRequirement(scheme_name="BearerAuth", scopes=[])]
+    )
+
+    fetch = MagicMock(wraps=provider.strategy.fetch)
+    monkeypatch.setattr(provider.strategy, "fetch", fetch)
+
+    result = provider.get_credentials([api_key_option, bearer_option])
+
+    assert len(result) == 2
+    assert fetch.call_args_list == [
+        call([api_key_option], None),
+        call([bearer_option], None),
+    ]
+
+
+def test_get_credentials_skips_invalid_option(env_mappings, api_key_req, basic_req, monkeypatch):
+    """Test that an invalid option is dropped without refetching the valid ones."""
+    monkeypatch.setenv("TEST_API_KEY", "test-api-key-value")
+
+    provider = CredentialProviderFactory.create_default(
+        env_mapping=env_mappings,
+        http_client=MagicMock(),
+        auth_requirements=[api_key_req, basic_req],
+    )
+    api_key_option = SecurityOption(
+        requirements=[SecurityRequirement(scheme_name="ApiKeyAuth", scopes=[])]
+    )
+    # Basic auth env vars are not set, so this option is invalid
+    basic_option = SecurityOption(
+        requirements=[SecurityRequirement(scheme_name="BasicAuth", scopes=[])]
+    )
+
+    fetch = MagicMock(wraps=provider.strategy.fetch)
+    monkeypatch.setattr(provider.strategy, "fetch", fetch)
+
+    result = provider.get_credentials([basic_option, api_key_option])
+
+    assert len(result) == 1
+    assert result[0].request_auth_value.auth_value == "test-api-key-value"
+    # The invalid option is not fetched a second time
+    assert fetch.call_count == 2
+
+
+def test_get_credentials_drops_partially_valid_combined_option(
+    env_mappings, api_key_req, basic_req, monkeypatch
+):
+    """Test that a combined (AND) option with one missing credential is dropped whole."""
+    monkeypatch.setenv("TEST_API_KEY", "test-api-key-value")
+
+    provider = CredentialProviderFactory.create_default(
+        env_mapping=env_mappings,
+        http_client=MagicMock(),
+        auth_requirements=[api_key_req, basic_req],
+    )
+    # Basic auth env vars are not set, so only half of this option can be met
+    combined_option = SecurityOption(
+        requirements=[
+            SecurityRequirement(scheme_name="ApiKeyAuth", scopes=[]),
+            SecurityRequirement(scheme_name="BasicAuth", scopes=[]),
+        ]
+    )
+    api_key_option = SecurityOption(
+        requirements=[SecurityRequirement(scheme_name="ApiKeyAuth", scopes=[])]
+    )
+
+    assert provider.get_credentials([combined_option]) == []
+
+    result = provider.get_credentials([combined_option, api_key_option])
+    assert len(result) == 1
+    assert result[0].request_auth_value.name == "ApiKey"
+
+
+def test_get_credentials_without_validators_or_transformers():
+    """Test that fetched credentials are returned unchanged when the pipeline is empty."""
+    credential = MagicMock(spec=Credential)
+    strategy = MagicMock()
+    strategy.fetch.return_value = [credential]
+    provider = CredentialProvider(strategy=strategy)
+
+    option = SecurityOption(requirements=[SecurityRequirement(scheme_name="ApiKeyAuth", scopes=[])])
+
+    assert provider.get_credentials([option]) == [credential]
+
+
+def test_empty_pipeline_skips_per_credential_loop():
+    """Test that an empty pipeline returns the credentials without walking the stages."""
+
+    class _IterationCountingList(list):
+        iterations = 0
+
+        def __iter__(self):
+            self.iterations += 1
+            return super().__iter__()
+
+    provider = CredentialProvider(strategy=MagicMock())
+    provider.validators = _IterationCountingList()
+    provider.transformers = _IterationCountingList()
+    credentials = [MagicMock(spec=Credential), MagicMock(spec=Credential)]
+
+    result = provider._validate_and_transform(credentials)
+
+    assert result == credentials
+    assert result is not credentials
+    assert provider.validators.iterations == 0
+    assert provider.transformers.iterations == 0
+
+
 def test_resolve_credentials_combined_requirements(
     env_mappings, api_key_req, bearer_req, monkeypatch
 ):
@@ -3,30 +3,42 @@
 Tests for the OpenAPI Extractor module.
 """
 
+import functools
 import json
 import logging
+import os
 import sys
+from collections import OrderedDict
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from arazzo_runner.extractor import openapi_extractor
 from arazzo_runner.extractor.openapi_extractor import (
+    _build_ref_index,
     _extract_media_type_schema,
+    _json_clone,
     _limit_dict_depth,
     _resolve_schema_refs,
+    _schema_key,
     extract_operation_io,
+    fold_all_of,
+    merge_json_schemas,
     resolve_schema,
 )
 
-# Configure specific logger for the extractor module for debug output
-extractor_logger = logging.getLogger("arazzo_runner.extractor.openapi_extractor")
-extractor_logger.setLevel(logging.DEBUG)
-# Ensure handler exists to output to stderr
-if not extractor_logger.hasHandlers():
-    handler = logging.StreamHandler(sys.stderr)
-    formatter = logging.Formatter("%(levelname)s:%(name)s:%(message)s")
-    handler.setFormatter(formatter)
-    extractor_logger.addHandler(handler)
+# Set ARAZZO_TEST_DEBUG=1 to send the extractor's debug output to stderr. It stays
+# off by default, as the resolver logs on every cycle it detects.
+if os.environ.get("ARAZZO_TEST_DEBUG"):
+    extractor_logger = logging.getLogger("arazzo_runner.extractor.openapi_extractor")
+    extractor_logger.setLevel(logging.DEBUG)
+    # Ensure handler exists to output to stderr
+    if not extractor_logger.hasHandlers():
+        handler = logging.StreamHandler(sys.stderr)
+        formatter = logging.Formatter("%(levelname)s:%(name)s:%(message)s")
+        handler.setFormatter(formatter)
+        extractor_logger.addHandler(handler)
 
 # Example spec from task.md (simplified slightly for testing focus)
 TEST_SPEC = {
@@ -202,26 +214,14 @@ def test_extract_order_post_details():
         "type": "object",
         "properties": {
             "id": {"type": "string", "format": "uuid"},
-            "items": {
-                "type": "array",
-                "items": {
-                    "type": "object",
-                    "properties": {
-                        "id": {"type": "string", "format": "uuid"},
-                        "product_id": {"type": "string"},
-                        "quantity": {"type": "integer"},
-                    },
-                    "required": ["product_id", "quantity"],
-                },
-            },
+            # Same resolved OrderItem array as the flattened 'items' input
+            "items": expected_items_schema,
             "status": {"type": "string", "enum": ["pending", "shipped", "delivered"]},
         },
         "required": ["items"],  # Add missing required field
     }
     # Check outputs with order-agnostic required array comparison
-    assert extracted["outputs"]["type"] == expected_resolved_output_schema["type"]
-    assert extracted["outputs"]["properties"] == expected_resolved_output_schema["properties"]
-    assert set(extracted["outputs"]["required"]) == set(expected_resolved_output_schema["required"])
+    _assert_schema_equal(extracted["outputs"], expected_resolved_output_schema)
 
     # --- Assert Security Requirements ---
     assert "security_requirements" in extracted
@@ -233,7 +233,7 @@ def test_extract_order_post_details():
     assert extracted["security_requirements"] == expected_security_req
 
     # --- Assert No Other Top-Level Keys (like old 'parameters', 'request_body', 'responses') ---
-    assert all(key in ["inputs", "outputs", "security_requirements"] for key in extracted.keys())
+    assert extracted.keys() <= {"inputs", "outputs", "security_requirements"}
 
 
 @pytest.mark.parametrize(
@@ -277,6 +277,22 @@ def test_limit_dict_depth(data, max_depth, expected):
     assert result == expected
 
 
+def test_limit_dict_depth_deep_structure_not_mutated():
+    """Tests that very deep structures are limited without recursion or mutating the input."""
+    data = leaf = {}
+    for _ in range(5000):
+        leaf["child"] = {"type": "object"}
+        leaf = leaf["child"]
+
+    result = _limit_dict_depth(data, 4500)
+
+    node = result
+    for _ in range(4499):
+        node = node["child"]
+    assert node["child"] == "object"
+    assert leaf == {"type": "object"}
+
+
 def test_extracts_implicit_url_param():
     """
     If a path parameter is present in the URL but not declared in the spec, it should still be extracted as required.
@@ -427,6 +443,151 @@ def test_extract_operation_io_depth_limits():
     assert output_schema.get("properties") == "object"
 
 
+def test_extract_operation_io_resolves_repeated_schema_once():
+    """Tests that parameters sharing a schema $ref are resolved once but not shared."""
+    spec = {
+        "openapi": "3.0.0",
+        "info": {"title": "Ids", "version": "1.0"},
+        "servers": [{"url": "https://api.example.com"}],
+        "paths": {
+            "/things": {
+                "get": {
+                    "parameters": [
+                        {
+                            "name": "from",
+                            "in": "query",
+                            "schema": {"$ref": "#/components/schemas/Id"},
+                        },
+                        {
+                            "name": "to",
+                            "in": "query",
+                            "schema": {"$ref": "#/components/schemas/Id"},
+                        },
+                    ],
+                    "responses": {"200": {"description": "OK"}},
+                }
+            }
+        },
+        "components": {"schemas": {"Id": {"type": "string", "format": "uuid"}}},
+    }
+
+    with patch.object(
+        openapi_extractor, "resolve_schema", wraps=openapi_extractor.resolve_schema
+    ) as resolve:
+        result = extract_operation_io(spec, "/things", "get")
+
+    assert resolve.call_count == 1
+    from_schema = result["inputs"]["properties"]["from"]["schema"]
+    to_schema = result["inputs"]["properties"]["to"]["schema"]
+    assert from_schema == to_schema == {"type": "string", "format": "uuid"}
+    assert from_schema is not to_schema
+
+
+def test_extract_operation_io_shared_oneof_body_and_response():
+    """Tests that flattening a oneOf request body does not leak into a response sharing it."""
+    shared_schema = {
+        "oneOf": [
+            {
+                "type": "object",
+                "additionalProperties": False,
+                "required": ["a"],
+                "properties": {"a": {"type": "string"}},
+            }
+        ]
+    }
+    spec = {
+        "openapi": "3.0.0",
+        "info": {"title": "SharedOneOf", "version": "1.0"},
+        "servers": [{"url": "https://api.example.com"}],
+        "paths": {
+            "/things": {
+                "post": {
+                    "requestBody": {"content": {"application/json": {"schema": shared_schema}}},
+                    "responses": {
+                        "200": {"content": {"application/json": {"schema": shared_schema}}}
+                    },
+                }
+            }
+        },
+    }
+
+    result = extract_operation_io(spec, "/things", "post")
+
+    # The flattened body marks "a" as required on its own copy only
+    assert result["inputs"]["properties"] == [{"a": {"type": "string", "required": True}}]
+    assert result["outputs"] == shared_schema
+
+
+def _depth_limit_spec(response_schema, schemas):
+    """Build a single-operation spec whose 200 response uses the given schema."""
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "DepthLimit", "version": "1.0"},
+        "servers": [{"url": "https://api.example.com"}],
+        "paths": {
+            "/nodes": {
+                "get": {
+                    "responses": {
+                        "200": {"content": {"application/json": {"schema": response_schema}}}
+                    }
+                }
+            }
+        },
+        "components": {"schemas": schemas},
+    }
+
+
+def test_extract_operation_io_depth_limit_matches_full_extraction():
+    """Tests that depth-limited output equals limiting the full output, cycles included."""
+    acyclic_spec = _depth_limit_spec(
+        {"$ref": "#/components/schemas/Level0"},
+        {
+            "Level0": {
+                "type": "object",
+                "properties": {"next": {"$ref": "#/components/schemas/Level1"}},
+            },
+            "Level1": {
+                "allOf": [
+                    {"type": "object"},
+                    {"properties": {"next": {"$ref": "#/components/schemas/Level2"}}},
+                ]
+            },
+            "Level2": {
+                "type": "object",
+                "properties": {"leaf": {"$ref": "#/components/schemas/Missing"}},
+            },
+        },
+    )
+    # A -> B -> C -> A, reached first through a deep property and then directly
+    cyclic_spec = _depth_limit_spec(
+        {
+            "type": "object",
+            "properties": {
+                "deep": {
+                    "type": "object",
+                    "properties": {"d2": {"$ref": "#/components/schemas/A"}},
+                },
+                "top": {"$ref": "#/components/schemas/C"},
+            },
+        },
+        {
+            "A": {"type": "object", "properties": {"b": {"$ref": "#/components/schemas/B"}}},
+            "B": {"type": "object", "properties": {"c": {"$ref": "#/components/schemas/C"}}},
+            "C": {"type": "object", "properties": {"a": {"$ref": "#/components/schemas/A"}}},
+        },
+    )
+
+    for spec in (acyclic_spec, cyclic_spec):
+        full = extract_operation_io(spec, "/nodes", "get")
+        for depth in range(7):
+            limited = extract_operation_io(spec, "/nodes", "get", output_max_depth=depth)
+            assert limited["outputs"] == _limit_dict_depth(full["outputs"], depth)
+
+    limited = extract_operation_io(cyclic_spec, "/nodes", "get", output_max_depth=5)
+    top = limited["outputs"]["properties"]["top"]
+    assert top["properties"]["a"] == {"$ref": "#/components/schemas/A"}
+
+
 def test_no_params_or_body():
     """
     If an operation has no parameters or body, extract_operation_io should return an empty inputs dict.
@@ -478,12 +639,10 @@ def test_resolve_schema_refs_circular_dependency():
     # Expect the recursion to stop and return the $ref at the point of circularity.
     # The 'SelfReferential' schema's 'child' property should still be a $ref to itself.
     assert isinstance(resolved_direct, dict), "Resolved direct schema should be a dict"
-    assert resolved_direct.get("type") == "object"
-    assert "properties" in resolved_direct
-    child_prop = resolved_direct.get("properties", {}).get("child")
-    assert isinstance(child_prop, dict), "Child property should be a dict"
+    assert resolved_direct["type"] == "object"
+    child_prop = resolved_direct["properties"]["child"]
     assert (
-        child_prop.get("$ref") == "#/components/schemas/SelfReferential"
+        child_prop["$ref"] == "#/components/schemas/SelfReferential"
     ), "Direct circular $ref was not preserved as expected"
 
     resolved_indirect = _resolve_schema_refs(schema_to_resolve_indirect, circular_spec)
@@ -492,14 +651,12 @@ def test_resolve_schema_refs_circular_dependency():
     assert isinstance(
         resolved_indirect, dict
     ), "Resolved indirect schema (IndirectA) should be a dict"
-    assert resolved_indirect.get("type") == "object"
-    link_to_b_prop = resolved_indirect.get("properties", {}).get("link_to_b")
-    assert isinstance(link_to_b_prop, dict), "link_to_b property (IndirectB) should be a dict"
-    assert link_to_b_prop.get("type") == "object"
-    link_to_a_prop = link_to_b_prop.get("properties", {}).get("link_to_a")
-    assert isinstance(link_to_a_prop, dict), "link_to_a property should be a dict"
+    assert resolved_indirect["type"] == "object"
+    link_to_b_prop = resolved_indirect["properties"]["link_to_b"]
+    assert link_to_b_prop["type"] == "object"
+    link_to_a_prop = link_to_b_prop["properties"]["link_to_a"]
     assert (
-        link_to_a_prop.get("$ref") == "#/components/schemas/IndirectA"
+        link_to_a_prop["$ref"] == "#/components/schemas/IndirectA"
     ), "Indirect circular $ref was not preserved as expected"
 
 
@@ -569,12 +726,12 @@ def test_resolve_schema_refs_complex_circular_dependency():
     # Direct self-reference through array items and allOf
     resolved_self = resolve_schema(schema_self, circular_spec)
     assert isinstance(resolved_self, dict)
-    assert resolved_self.get("type") == "object"
+    assert resolved_self["type"] == "object"
+    self_properties = resolved_self["properties"]
     # children is an array and items keeps $ref to SelfReferential (cycle preserved)
-    children = resolved_self.get("properties", {}).get("children")
-    assert isinstance(children, dict) and children.get("type") == "array"
-    assert isinstance(children.get("items"), dict)
-    assert children.get("items").get("$ref") == "#/components/schemas/SelfReferential"
+    children = self_properties["children"]
+    assert children["type"] == "array"
+    assert children["items"]["$ref"] == "#/components/schemas/SelfReferential"
     # allOf should be merged and removed, with circular references merged as siblings
     assert "allOf" not in resolved_self, "allOf should be merged and removed"
 
@@ -583,31 +740,27 @@ def test_resolve_schema_refs_complex_circular_dependency():
     assert resolved_self["$ref"] == "#/components/schemas/SelfReferential"
 
     # Check that properties from non-circular allOf items are merged
-    assert "tag" in resolved_self.get(
-        "properties", {}
-    ), "Tag property from allOf should be merged into main properties"
-    assert resolved_self["properties"]["tag"]["type"] == "string"
+    assert "tag" in self_properties, "Tag property from allOf should be merged into main properties"
+    assert self_properties["tag"]["type"] == "string"
 
     # Indirect cycle with allOf on B
     resolved_indirect = resolve_schema(schema_indirect, circular_spec)
     assert isinstance(resolved_indirect, dict)
-    assert resolved_indirect.get("type") == "object"
-    link_to_b = resolved_indirect.get("properties", {}).get("link_to_b")
-    assert isinstance(link_to_b, dict) and link_to_b.get("type") == "object"
+    assert resolved_indirect["type"] == "object"
+    link_to_b = resolved_indirect["properties"]["link_to_b"]
+    assert link_to_b["type"] == "object"
+    b_properties = link_to_b["properties"]
     # B should still reference A under link_to_a, preserving the cycle
-    link_to_a = link_to_b.get("properties", {}).get("link_to_a")
-    assert isinstance(link_to_a, dict)
-    assert link_to_a.get("$ref") == "#/components/schemas/IndirectA"
+    assert b_properties["link_to_a"]["$ref"] == "#/components/schemas/IndirectA"
     # allOf on B should be merged and the extra property should be in the main properties
     assert "allOf" not in link_to_b, "allOf should be merged and removed"
-    b_properties = link_to_b.get("properties", {})
     assert "extra" in b_properties, "Extra property from allOf should be merged into properties"
     assert b_properties["extra"]["type"] == "string"
 
     # Diamond cycle via oneOf
     resolved_diamond = resolve_schema(schema_diamond, circular_spec)
     assert isinstance(resolved_diamond, dict)
-    oneof = resolved_diamond.get("properties", {}).get("next", {}).get("oneOf")
+    oneof = resolved_diamond["properties"]["next"]["oneOf"]
     assert isinstance(oneof, list)
 
     # At least one branch should resolve to an object that points back to DiamondA via $ref somewhere
@@ -615,11 +768,10 @@ def test_resolve_schema_refs_complex_circular_dependency():
         if not isinstance(branch, dict):
             return False
         # resolved branch may be dict with properties.back as $ref
-        back = (
-            branch.get("properties", {}).get("back")
-            if isinstance(branch.get("properties"), dict)
-            else None
-        )
+        properties = branch.get("properties")
+        if not isinstance(properties, dict):
+            return False
+        back = properties.get("back")
         return isinstance(back, dict) and back.get("$ref") == "#/components/schemas/DiamondA"
 
     assert any(
@@ -629,6 +781,160 @@ def test_resolve_schema_refs_complex_circular_dependency():
     )
 
 
+def test_resolve_schema_refs_shared_cache_keeps_cycle_semantics():
+    """Tests that a cache shared across calls only reuses cycle-free resolutions."""
+    spec = {
+        "components": {
+            "schemas": {
+                "Item": {"type": "object", "properties": {"sku": {"type": "string"}}},
+                "IndirectA": {
+                    "type": "object",
+                    "properties": {
+                        "item": {"$ref": "#/components/schemas/Item"},
+                        "link_to_b": {"$ref": "#/components/schemas/IndirectB"},
+                    },
+                },
+                "IndirectB": {
+                    "type": "object",
+                    "properties": {"link_to_a": {"$ref": "#/components/schemas/IndirectA"}},
+                },
+            }
+        }
+    }
+    cache = {}
+
+    resolved_a = _resolve_schema_refs({"$ref": "#/components/schemas/IndirectA"}, spec, cache=cache)
+    # Only the cycle-free target is kept for later calls
+    assert set(cache) == {"#/components/schemas/Item"}
+    assert resolved_a["properties"]["item"] is cache["#/components/schemas/Item"]
+
+    # B resolved on its own still expands A once before the cycle is cut
+    resolved_b = _resolve_schema_refs({"$ref": "#/components/schemas/IndirectB"}, spec, cache=cache)
+    link_to_a = resolved_b["properties"]["link_to_a"]
+    assert link_to_a["properties"]["item"] == {
+        "type": "object",
+        "properties": {"sku": {"type": "string"}},
+    }
+    assert link_to_a["properties"]["link_to_b"] == {"$ref": "#/components/schemas/IndirectB"}
+
+
+def test_json_clone_copies_containers_only():
+    """Tests that _json_clone deep copies dicts and lists and keeps scalars."""
+    original = {"type": "object", "properties": {"tags": {"enum": ["a", "b"]}}, "nullable": None}
+
+    cloned = _json_clone(original)
+
+    assert cloned == original
+    assert cloned["properties"] is not original["properties"]
+    assert cloned["properties"]["tags"]["enum"] is not original["properties"]["tags"]["enum"]
+    cloned["properties"]["tags"]["enum"].append("c")
+    assert original["properties"]["tags"]["enum"] == ["a", "b"]
+
+
+def test_schema_key_is_canonical():
+    """Tests that memo keys ignore key order and reject non-JSON values."""
+    assert _schema_key({"type": "string", "format": "uuid"}) == _schema_key(
+        {"format": "uuid", "type": "string"}
+    )
+    assert _schema_key({"$ref": "#/a"}) != _schema_key({"$ref": "#/b"})
+    # Integer keys (e.g. YAML response codes) still produce a key
+    assert _schema_key({200: {"description": "OK"}})
+    with pytest.raises(TypeError):
+        _schema_key({"default": object()})
+
+
+def test_resolve_schema_refs_reuses_ref_free_subtrees():
+    """Tests that subtrees without refs are returned as-is rather than copied."""
+    address = {"type": "object", "properties": {"city": {"type": "string"}}}
+    spec = {"components": {"schemas": {"Id": {"type": "string"}}}}
+    schema = {
+        "type": "object",
+        "properties": {"id": {"$ref": "#/components/schemas/Id"}, "address": address},
+    }
+
+    resolved = _resolve_schema_refs(schema, spec)
+
+    assert resolved is not schema
+    assert resolved["properties"]["id"] == {"type": "string"}
+    assert resolved["properties"]["address"] is address
+    assert _resolve_schema_refs(address, spec) is address
+    # The input schema is left untouched
+    assert schema["properties"]["id"] == {"$ref": "#/components/schemas/Id"}
+
+
+def test_dict_and_list_subclasses_are_resolved_and_copied():
+    """Tests that specs loaded into dict subclasses (e.g. OrderedDict) are fully handled."""
+    spec_json = json.dumps(
+        {
+            "openapi": "3.0.0",
+            "info": {"title": "Ordered", "version": "1.0"},
+            "servers": [{"url": "https://api.example.com"}],
+            "paths": {
+                "/pets": {
+                    "get": {
+                        "responses": {
+                            "200": {
+                                "content": {
+                                    "application/json": {
+                                        "schema": {
+                                            "type": "object",
+                                            "properties": {
+                                                "pet": {"$ref": "#/components/schemas/Pet"}
+                                            },
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            },
+            "components": {
+                "schemas": {
+                    "Pet": {
+                        "type": "object",
+                        "properties": {"tags": {"type": "array", "items": {"type": "string"}}},
+                    }
+                }
+            },
+        }
+    )
+    spec = json.loads(spec_json, object_pairs_hook=OrderedDict)
+
+    extracted = extract_operation_io(spec, "/pets", "get")
+    assert (
+        extracted["outputs"]["properties"]["pet"]
+        == json.loads(spec_json)["components"]["schemas"]["Pet"]
+    )
+
+    pet = spec["components"]["schemas"]["Pet"]
+    cloned = _json_clone(pet)
+    assert cloned == pet
+    assert cloned["properties"] is not pet["properties"]
+    assert _limit_dict_depth(pet, 1) == {"type": "object", "properties": "object"}
+
+
+def test_build_ref_index_escapes_component_names():
+    """Tests that the ref index keys match the JSON pointers used in $ref values."""
+    pet = {"type": "object"}
+    spec = {
+        "components": {
+            "schemas": {"Pet": pet, "a/b~c": {"type": "string"}},
+            "parameters": {"limit": {"name": "limit", "in": "query"}},
+        }
+    }
+
+    index = _build_ref_index(spec)
+
+    assert index["#/components/schemas/Pet"] is pet
+    assert index["#/components/schemas/a~1b~0c"] == {"type": "string"}
+    assert "#/components/parameters/limit" in index
+    assert _resolve_schema_refs(
+        {"$ref": "#/components/schemas/a~1b~0c"}, spec, ref_index=index
+    ) == {"type": "string"}
+    assert _build_ref_index({}) == {}
+
+
 def test_resolve_schema_refs_allof_merging():
     """Tests that _resolve_schema_refs properly merges allOf schemas."""
     spec = _load_test_spec("allof_merging/allof_merging_test_spec.json")
@@ -648,10 +954,38 @@ def test_resolve_schema_refs_allof_merging():
     }
 
     # Check main structure
-    assert resolved["type"] == expected_schema["type"]
-    assert resolved["properties"] == expected_schema["properties"]
-    # Check required fields separately (order doesn't matter)
-    assert set(resolved["required"]) == set(expected_schema["required"])
+    _assert_schema_equal(resolved, expected_schema)
+
+
+def test_fold_all_of_simple_branches_match_general_merge():
+    """Tests that the single-pass allOf fold agrees with merging branch by branch."""
+    branches = [
+        {"type": "object", "properties": {"id": {"type": "string"}}, "required": ["id"]},
+        {"description": "extra", "properties": {"name": {"type": "string"}}},
+        {"type": "object", "required": ["name", "id"]},
+    ]
+    general = {}
+    for branch in branches:
+        general = merge_json_schemas(general, branch)
+
+    folded = fold_all_of({"allOf": branches})
+
+    assert folded["properties"] == general["properties"]
+    assert folded["required"] == ["id", "name"]
+    assert sorted(folded["required"]) == sorted(general["required"])
+    assert folded["type"] == general["type"] == "object"
+    assert folded["description"] == general["description"] == "extra"
+
+    # Overlapping properties still go through the recursive merger
+    overlapping = fold_all_of(
+        {
+            "allOf": [
+                {"properties": {"id": {"type": "string"}}},
+                {"properties": {"id": {"format": "uuid"}}},
+            ]
+        }
+    )
+    assert overlapping["properties"]["id"] == {"type": "string", "format": "uuid"}
 
 
 def test_resolve_schema_refs_allof_with_nested_refs():
@@ -780,8 +1114,6 @@ def test_resolve_schema_refs_oneof_behavior():
 
 def test_merge_json_schemas_boolean_schemas():
     """Test that Boolean JSON Schemas (true/false) are handled correctly."""
-    from arazzo_runner.extractor.openapi_extractor import merge_json_schemas
-
     # Test Boolean schemas - Booleans take precedence during merging
     assert merge_json_schemas(True, {"type": "string"}) is True
     assert merge_json_schemas(False, {"type": "string"}) is False
@@ -804,18 +1136,40 @@ def test_merge_json_schemas_boolean_schemas():
     assert resolved == {}
 
 
+def test_merge_json_schemas_required_order():
+    """Test that merged required fields are de-duplicated in a stable order."""
+    merged = merge_json_schemas({"required": ["id", "name"]}, {"required": ["name", "email"]})
+
+    assert merged["required"] == ["id", "name", "email"]
+
+
+_TEST_DATA_DIR = Path(__file__).resolve().parent.parent / "test_data"
+
+
+@functools.cache
+def _read_test_spec(relative_path: str) -> bytes:
+    """Read a test specification's raw JSON, once per file per session."""
+    return (_TEST_DATA_DIR / relative_path).read_bytes()
+
+
 def _load_test_spec(relative_path: str):
-    """Load a test specification from the test_data directory."""
-    spec_path = Path(__file__).parent.parent / "test_data" / relative_path
-    with open(spec_path) as f:
-        return json.load(f)
+    """Load a test specification from the test_data directory.
+
+    Only the file contents are cached; each call parses a fresh dict so tests
+    can't leak changes to one another through a shared spec.
+    """
+    return json.loads(_read_test_spec(relative_path))
+
+
+def _body_content(spec, path, method="post"):
+    """Return the requestBody content map of an operation in a test spec."""
+    return spec["paths"][path][method]["requestBody"]["content"]
 
 
 def test_extract_media_type_schema_form_encoded():
     """Test _extract_media_type_schema with form-encoded content only."""
     spec = _load_test_spec("encoding_types/encoding_test_spec.json")
-    chat_operation = spec["paths"]["/chat.postMessage"]["post"]
-    body_content = chat_operation["requestBody"]["content"]
+    body_content = _body_content(spec, "/chat.postMessage")
 
     result = _extract_media_type_schema(body_content)
     expected = {
@@ -832,8 +1186,7 @@ def test_extract_media_type_schema_form_encoded():
 def test_extract_media_type_schema_json():
     """Test _extract_media_type_schema with JSON content only."""
     spec = _load_test_spec("encoding_types/encoding_test_spec.json")
-    users_operation = spec["paths"]["/users.create"]["post"]
-    body_content = users_operation["requestBody"]["content"]
+    body_content = _body_content(spec, "/users.create")
 
     result = _extract_media_type_schema(body_content)
     expected = {
@@ -851,8 +1204,7 @@ def test_extract_media_type_schema_json():
 def test_extract_media_type_schema_both_types():
     """Test _extract_media_type_schema with both JSON and form-encoded content."""
     spec = _load_test_spec("encoding_types/encoding_test_spec.json")
-    messages_operation = spec["paths"]["/messages.send"]["post"]
-    body_content = messages_operation["requestBody"]["content"]
+    body_content = _body_content(spec, "/messages.send")
 
     result = _extract_media_type_schema(body_content)
     # Should return JSON schema (first supported type found)
@@ -870,8 +1222,7 @@ def test_extract_media_type_schema_both_types():
 def test_extract_media_type_schema_json_with_parameter():
     """Test _extract_media_type_schema with JSON content that has extra parameters."""
     spec = _load_test_spec("encoding_types/encoding_test_spec.json")
-    data_operation = spec["paths"]["/data.upload"]["post"]
-    body_content = data_operation["requestBody"]["content"]
+    body_content = _body_content(spec, "/data.upload")
 
     result = _extract_media_type_schema(body_content)
     expected = {
@@ -897,104 +1248,73 @@ def test_extract_media_type_schema_unsupported():
     assert result is None
 
 
-def test_boolean_schema_true_accepts_any():
-    """Test that true Boolean schemas accept any input and output."""
-    spec = _load_test_spec("boolean_schemas/boolean_schema_test_spec.json")
-    result = extract_operation_io(spec, "/accept-any", "post")
-
-    # Both input and output should be converted to empty schema objects
-    expected_inputs = {"type": "object", "properties": {}, "required": []}
-    expected_outputs = {}
-
-    assert result["inputs"] == expected_inputs
-    assert result["outputs"] == expected_outputs
-
-
-def test_boolean_schema_false_rejects_all():
-    """Test that false Boolean schemas reject all input and output."""
-    spec = _load_test_spec("boolean_schemas/boolean_schema_test_spec.json")
-    result = extract_operation_io(spec, "/reject-all", "post")
-
-    # Input should be empty schema, output should be rejection schema
-    expected_inputs = {"type": "object", "properties": {}, "required": []}
-    expected_outputs = {"not": {}}
-
-    assert result["inputs"] == expected_inputs
-    assert result["outputs"] == expected_outputs
-
-
-def test_boolean_schema_allof_precedence():
-    """Test that Boolean schemas take precedence in allOf arrays."""
-    spec = _load_test_spec("boolean_schemas/boolean_schema_test_spec.json")
-    result = extract_operation_io(spec, "/mixed-boolean", "post")
-
-    # Input: true takes precedence over object schema
-    expected_inputs = {"type": "object", "properties": {}, "required": []}
-    # Output: false takes precedence over object schema
-    expected_outputs = {"not": {}}
-
-    assert result["inputs"] == expected_inputs
-    assert result["outputs"] == expected_outputs
-
-
-def test_boolean_schema_false_body_with_parameters():
-    """Test that false request body schema doesn't interfere with parameter processing."""
-    spec = _load_test_spec("boolean_schemas/boolean_schema_test_spec.json")
-    result = extract_operation_io(spec, "/reject-body-with-params", "post")
-
-    # Input should contain parameters but no body properties (since body schema is false)
-    expected_inputs = {
-        "type": "object",
-        "properties": {
-            "user_id": {"type": "string", "schema": {"type": "string"}},
-            "limit": {"type": "integer", "schema": {"type": "integer"}},
-        },
-        "required": ["user_id"],
-    }
-
-    # Output should be the resolved response schema
-    expected_outputs = {
-        "type": "object",
-        "properties": {"message": {"type": "string"}, "user_id": {"type": "string"}},
+def _assert_schema_equal(actual, expected):
+    """Compare two schemas exactly, except for the order of their 'required' lists."""
+    assert {k: v for k, v in actual.items() if k != "required"} == {
+        k: v for k, v in expected.items() if k != "required"
     }
-
-    # Check inputs with order-agnostic required array comparison
-    assert result["inputs"]["type"] == expected_inputs["type"]
-    assert result["inputs"]["properties"] == expected_inputs["properties"]
-    assert set(result["inputs"]["required"]) == set(expected_inputs["required"])
-
-    # Check outputs
-    assert result["outputs"] == expected_outputs
+    assert sorted(actual.get("required", ())) == sorted(expected.get("required", ()))
 
 
-def test_boolean_schema_true_body_with_parameters():
-    """Test that true request body schema doesn't interfere with parameter processing."""
-    spec = _load_test_spec("boolean_schemas/boolean_schema_test_spec.json")
-    result = extract_operation_io(spec, "/accept-body-with-params", "post")
+def _assert_io_equal(result, expected_inputs, expected_outputs):
+    """Compare extracted inputs and outputs, ignoring the order of 'required' lists."""
+    _assert_schema_equal(result["inputs"], expected_inputs)
+    _assert_schema_equal(result["outputs"], expected_outputs)
 
-    # Input should contain parameters but no body properties (since body schema is true and gets converted to {})
-    expected_inputs = {
-        "type": "object",
-        "properties": {
-            "api_key": {"type": "string", "schema": {"type": "string"}},
-            "timeout": {"type": "integer", "schema": {"type": "integer"}},
-        },
-        "required": ["api_key"],
-    }
 
-    # Output should be the resolved response schema
-    expected_outputs = {
-        "type": "object",
-        "properties": {"status": {"type": "string"}, "api_key": {"type": "string"}},
-    }
+@pytest.fixture(scope="module")
+def boolean_schema_spec():
+    """The Boolean schema spec, shared read-only by the parametrized cases below."""
+    return _load_test_spec("boolean_schemas/boolean_schema_test_spec.json")
 
-    # Check inputs with order-agnostic required array comparison
-    assert result["inputs"]["type"] == expected_inputs["type"]
-    assert result["inputs"]["properties"] == expected_inputs["properties"]
-    assert set(result["inputs"]["required"]) == set(expected_inputs["required"])
 
-    # Check outputs
-    assert result["outputs"] == expected_outputs
+@pytest.mark.parametrize(
+    "path, expected_inputs, expected_outputs",
+    [
+        # true schemas accept any input and output, converted to empty schema objects
+        ("/accept-any", {"type": "object", "properties": {}, "required": []}, {}),
+        # false schemas reject all: empty inputs, rejection schema for outputs
+        ("/reject-all", {"type": "object", "properties": {}, "required": []}, {"not": {}}),
+        # Boolean schemas take precedence in allOf arrays: true for input, false for output
+        ("/mixed-boolean", {"type": "object", "properties": {}, "required": []}, {"not": {}}),
+        # A false request body doesn't interfere with parameter processing
+        (
+            "/reject-body-with-params",
+            {
+                "type": "object",
+                "properties": {
+                    "user_id": {"type": "string", "schema": {"type": "string"}},
+                    "limit": {"type": "integer", "schema": {"type": "integer"}},
+                },
+                "required": ["user_id"],
+            },
+            {
+                "type": "object",
+                "properties": {"message": {"type": "string"}, "user_id": {"type": "string"}},
+            },
+        ),
+        # A true request body becomes {} and contributes no body properties
+        (
+            "/accept-body-with-params",
+            {
+                "type": "object",
+                "properties": {
+                    "api_key": {"type": "string", "schema": {"type": "string"}},
+                    "timeout": {"type": "integer", "schema": {"type": "integer"}},
+                },
+                "required": ["api_key"],
+            },
+            {
+                "type": "object",
+                "properties": {"status": {"type": "string"}, "api_key": {"type": "string"}},
+            },
+        ),
+    ],
+)
+def test_boolean_schema_extraction(boolean_schema_spec, path, expected_inputs, expected_outputs):
+    """Tests how true/false Boolean schemas in bodies and responses are extracted."""
+    result = extract_operation_io(boolean_schema_spec, path, "post")
+    _assert_io_equal(result, expected_inputs, expected_outputs)
 
 
 def test_extract_operation_io_request_body_oneof_with_boolean_schemas():
@@ -1091,7 +1411,7 @@ def test_extract_operation_io_parameter_oneof_with_boolean_schemas():
     # Check inputs with order-agnostic required array comparison
     assert result["inputs"]["type"] == expected_inputs["type"]
     assert result["inputs"]["properties"]["filter"] == expected_inputs["properties"]["filter"]
-    assert set(result["inputs"]["required"]) == set(expected_inputs["required"])
+    assert sorted(result["inputs"]["required"]) == sorted(expected_inputs["required"])
 
     # Check outputs
     assert result["outputs"] == expected_outputs
@@ -1222,10 +1542,7 @@ def test_extract_operation_io_request_body_oneof_with_query_parameters():
     }
 
     # Check inputs with order-agnostic required array comparison
-    assert result["inputs"]["type"] == expected_inputs["type"]
-    assert result["inputs"]["properties"] == expected_inputs["properties"]
-    assert result["inputs"]["strategy"] == expected_inputs["strategy"]
-    assert set(result["inputs"]["required"]) == set(expected_inputs["required"])
+    _assert_schema_equal(result["inputs"], expected_inputs)
 
     # Check outputs
     assert result["outputs"] == expected_outputs
@@ -1263,10 +1580,7 @@ def test_extract_operation_io_request_body_anyof_with_query_parameters():
     }
 
     # Check inputs with order-agnostic required array comparison
-    assert result["inputs"]["type"] == expected_inputs["type"]
-    assert result["inputs"]["properties"] == expected_inputs["properties"]
-    assert result["inputs"]["strategy"] == expected_inputs["strategy"]
-    assert set(result["inputs"]["required"]) == set(expected_inputs["required"])
+    _assert_schema_equal(result["inputs"], expected_inputs)
 
     # Check outputs
     assert result["outputs"] == expected_outputs
@@ -1320,10 +1634,7 @@ def test_extract_operation_io_complex_oneof_request_body_with_parameters():
     }
 
     # Check inputs with order-agnostic required array comparison
-    assert result["inputs"]["type"] == expected_inputs["type"]
-    assert result["inputs"]["properties"] == expected_inputs["properties"]
-    assert result["inputs"]["strategy"] == expected_inputs["strategy"]
-    assert set(result["inputs"]["required"]) == set(expected_inputs["required"])
+    _assert_schema_equal(result["inputs"], expected_inputs)
 
     # Check outputs
     assert result["outputs"] == expected_outputs
@@ -1361,8 +1672,8 @@ def test_sibling_merge_basic():
     assert result["outputs"]["properties"] == expected_outputs["properties"]
 
     # Test required fields separately (order doesn't matter)
-    assert set(result["inputs"]["required"]) == {"name", "email"}
-    assert set(result["outputs"]["required"]) == {"name"}
+    assert sorted(result["inputs"]["required"]) == ["email", "name"]
+    assert sorted(result["outputs"]["required"]) == ["name"]
 
 
 def test_sibling_merge_complex():
@@ -1405,8 +1716,8 @@ def test_sibling_merge_complex():
     assert result["outputs"]["properties"] == expected_outputs["properties"]
 
     # Test required fields separately (order doesn't matter)
-    assert set(result["inputs"]["required"]) == {"price"}
-    assert set(result["outputs"]["required"]) == {"name", "inventory"}
+    assert sorted(result["inputs"]["required"]) == ["price"]
+    assert sorted(result["outputs"]["required"]) == ["inventory", "name"]
 
 
 def test_sibling_merge_nested():
@@ -1463,13 +1774,9 @@ def test_sibling_merge_nested():
     }
 
     # Check inputs and outputs with order-agnostic required array comparison
-    assert result["inputs"]["type"] == expected_inputs["type"]
-    assert result["inputs"]["properties"] == expected_inputs["properties"]
-    assert set(result["inputs"]["required"]) == set(expected_inputs["required"])
+    _assert_schema_equal(result["inputs"], expected_inputs)
 
-    assert result["outputs"]["type"] == expected_outputs["type"]
-    assert result["outputs"]["properties"] == expected_outputs["properties"]
-    assert set(result["outputs"]["required"]) == set(expected_outputs["required"])
+    _assert_schema_equal(result["outputs"], expected_outputs)
 
 
 def test_sibling_merge_boolean():
@@ -1554,20 +1861,13 @@ def test_sibling_merge_additional_properties():
     }
 
     # Test the main structure with order-agnostic required array comparison
-    assert result["inputs"]["type"] == expected_inputs["type"]
-    assert result["inputs"]["properties"] == expected_inputs["properties"]
-    assert set(result["inputs"]["required"]) == set(expected_inputs["required"])
+    _assert_schema_equal(result["inputs"], expected_inputs)
 
-    assert result["outputs"]["type"] == expected_outputs["type"]
-    assert result["outputs"]["properties"] == expected_outputs["properties"]
-    assert set(result["outputs"]["required"]) == set(expected_outputs["required"])
-    assert result["outputs"]["additionalProperties"] is True
+    _assert_schema_equal(result["outputs"], expected_outputs)
 
 
 def test_merge_json_schemas_additional_properties_false_constraint():
     """Test that merge_json_schemas respects additionalProperties: false constraint."""
-    from arazzo_runner.extractor.openapi_extractor import merge_json_schemas
-
     # Test case 1: base schema with additionalProperties: false should not be merged
     base_schema = {
         "type": "object",
@@ -1618,11 +1918,7 @@ def test_sibling_merge_ref_with_type_and_properties():
     }
 
     # Check inputs
-    assert result["inputs"]["type"] == expected_inputs["type"]
-    assert result["inputs"]["properties"] == expected_inputs["properties"]
-    assert set(result["inputs"]["required"]) == set(expected_inputs["required"])
+    _assert_schema_equal(result["inputs"], expected_inputs)
 
     # Check outputs
-    assert result["outputs"]["type"] == expected_outputs["type"]
-    assert result["outputs"]["properties"] == expected_outputs["properties"]
-    assert set(result["outputs"]["required"]) == set(expected_outputs["required"])
+    _assert_schema_equal(result["outputs"], expected_outputs)
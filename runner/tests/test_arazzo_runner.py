@@ -11,6 +11,7 @@ import json
 import os
 import tempfile
 import unittest
+from functools import cached_property
 
 import yaml
 
@@ -22,7 +23,11 @@ class MockHTTPExecutor:
     """Mock HTTP client for testing"""
 
     def __init__(self, mock_responses=None):
-        self.mock_responses = mock_responses or {}
+        # Normalize methods once so lookups match however the table was written
+        self.mock_responses = {
+            (method.lower(), url): response
+            for (method, url), response in (mock_responses or {}).items()
+        }
         self.requests = []
 
     def request(self, method, url, **kwargs):
@@ -54,21 +59,19 @@ class MockResponse:
         if json_data is not None and not any(k.lower() == "content-type" for k in self.headers):
             self.headers["Content-Type"] = "application/json"
 
-        self.content = content or b""
+        self._content = content
 
-        # Generate content attribute like real requests.Response
-        if content is not None:
+    @cached_property
+    def content(self):
+        """Body bytes like requests.Response.content, encoded on first access"""
+        if self._content is not None:
             # Use explicitly provided content
-            self.content = content
-        elif self._json_data is not None:
+            return self._content
+        if self._json_data is not None:
             # JSON content gets encoded as UTF-8 bytes
-            self.content = json.dumps(self._json_data).encode("utf-8")
-        elif self.text:
-            # Text content gets encoded as UTF-8 bytes
-            self.content = self.text.encode("utf-8")
-        else:
-            # Default to empty bytes
-            self.content = b""
+            return json.dumps(self._json_data).encode("utf-8")
+        # Text content gets encoded as UTF-8 bytes, defaulting to empty bytes
+        return self.text.encode("utf-8")
 
     def json(self):
         if self._json_data is None:
@@ -84,14 +87,28 @@ class MockResponse:
 class TestArazzoRunner(unittest.TestCase):
     """Test the Arazzo Runner functionality"""
 
-    def setUp(self):
-        """Set up test fixtures"""
+    @classmethod
+    def setUpClass(cls):
+        """Write the fixture files shared by every test in the class"""
         # Create temporary directory for test files
-        self.temp_dir = tempfile.TemporaryDirectory()
-
-        # Create example OpenAPI spec
-        self.openapi_path = os.path.join(self.temp_dir.name, "test_openapi.yaml")
-        self.openapi_spec = {
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.openapi_path = os.path.join(cls.temp_dir.name, "test_openapi.yaml")
+        cls.arazzo_path = os.path.join(cls.temp_dir.name, "test_workflow.yaml")
+
+        with open(cls.openapi_path, "w") as f:
+            yaml.dump(cls._build_openapi_spec(), f)
+        with open(cls.arazzo_path, "w") as f:
+            yaml.dump(cls._build_arazzo_doc(), f)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared fixture files"""
+        cls.temp_dir.cleanup()
+
+    @staticmethod
+    def _build_openapi_spec():
+        """Create example OpenAPI spec"""
+        return {
             "openapi": "3.0.0",
             "info": {"title": "Test API", "description": "API for testing", "version": "1.0.0"},
             "servers": [{"url": "https://api.example.com/v1"}],
@@ -130,21 +147,17 @@ class TestArazzoRunner(unittest.TestCase):
             },
         }
 
-        with open(self.openapi_path, "w") as f:
-            yaml.dump(self.openapi_spec, f)
-
-        # Create example Arazzo workflow
-        self.arazzo_path = os.path.join(self.temp_dir.name, "test_workflow.yaml")
-        self.arazzo_doc = {
+    @classmethod
+    def _build_arazzo_doc(cls):
+        """Create example Arazzo workflow"""
+        return {
             "arazzo": "1.0.0",
             "info": {
                 "title": "Test Workflow",
                 "description": "A workflow for testing",
                 "version": "1.0.0",
             },
-            "sourceDescriptions": [
-                {"name": "testApi", "url": self.openapi_path, "type": "openapi"}
-            ],
+            "sourceDescriptions": [{"name": "testApi", "url": cls.openapi_path, "type": "openapi"}],
             "workflows": [
                 {
                     "workflowId": "testWorkflow",
@@ -194,8 +207,11 @@ class TestArazzoRunner(unittest.TestCase):
             ],
         }
 
-        with open(self.arazzo_path, "w") as f:
-            yaml.dump(self.arazzo_doc, f)
+    def setUp(self):
+        """Set up test fixtures"""
+        # Fresh documents for each test, as the runner holds on to and may modify them
+        self.openapi_spec = self._build_openapi_spec()
+        self.arazzo_doc = self._build_arazzo_doc()
 
         # Set up source descriptions
         self.source_descriptions = {"testApi": self.openapi_spec}
@@ -219,10 +235,6 @@ class TestArazzoRunner(unittest.TestCase):
             http_client=self.http_client,
         )
 
-    def tearDown(self):
-        """Clean up test fixtures"""
-        self.temp_dir.cleanup()
-
     def test_load_arazzo_doc(self):
         """Test that the Arazzo document loads correctly"""
         self.assertEqual(self.runner.arazzo_doc["arazzo"], "1.0.0")
@@ -1,8 +1,26 @@
 """Tests for the utils module."""
 
+import json
+import logging
+import math
+import os
+import tempfile
 import unittest
+import warnings
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
-from arazzo_runner.utils import extract_api_title_prefix
+from arazzo_runner.utils import (
+    _json_loads,
+    deprecated,
+    dump_state,
+    evaluate_json_pointer,
+    extract_api_title_prefix,
+    extract_json_pointer_from_expression,
+    load_arazzo_doc,
+    load_openapi_file,
+    load_source_descriptions,
+)
 
 
 class TestExtractApiTitlePrefix(unittest.TestCase):
@@ -43,3 +61,305 @@ class TestExtractApiTitlePrefix(unittest.TestCase):
         self.assertEqual(extract_api_title_prefix("My-API 123"), "MY_API")
         self.assertEqual(extract_api_title_prefix("The My-API 2.0"), "MY_API")
         self.assertEqual(extract_api_title_prefix("My-API 2.0"), "MY_API")
+
+
+class TestJsonLoads(unittest.TestCase):
+    """Test cases for the _json_loads helper."""
+
+    def test_text_and_bytes(self):
+        """Test decoding both str and UTF-8 bytes input."""
+        self.assertEqual(_json_loads('{"a": [1, "b"]}'), {"a": [1, "b"]})
+        self.assertEqual(_json_loads(b'{"a": [1, "b"]}'), {"a": [1, "b"]})
+
+    def test_stdlib_only_values(self):
+        """Test that NaN, which orjson rejects, still decodes via the stdlib."""
+        self.assertTrue(math.isnan(_json_loads('{"x": NaN}')["x"]))
+
+    def test_invalid_json(self):
+        """Test that invalid JSON raises json.JSONDecodeError."""
+        with self.assertRaises(json.JSONDecodeError):
+            _json_loads("{not json")
+
+
+class TestExtractJsonPointerFromExpression(unittest.TestCase):
+    """Test cases for the extract_json_pointer_from_expression function."""
+
+    def test_explicit_pointer(self):
+        """Test the $container#/pointer form."""
+        self.assertEqual(
+            extract_json_pointer_from_expression("$response.body#/data/0/id"),
+            ("response.body", "/data/0/id"),
+        )
+
+    def test_dot_notation(self):
+        """Test that dot notation is converted to a JSON pointer."""
+        self.assertEqual(
+            extract_json_pointer_from_expression("$response.body.data.id"),
+            ("response", "/body/data/id"),
+        )
+
+    def test_not_a_pointer_expression(self):
+        """Test inputs that are not pointer expressions."""
+        self.assertEqual(extract_json_pointer_from_expression("plain text"), (None, None))
+        self.assertEqual(extract_json_pointer_from_expression(42), (None, None))
+
+
+class TestEvaluateJsonPointer(unittest.TestCase):
+    """Test cases for the evaluate_json_pointer function."""
+
+    def test_resolve(self):
+        """Test resolving pointers, including repeated use of the same pointer."""
+        data = {"products": [{"name": "Widget"}, {"name": "Gadget"}]}
+        self.assertEqual(evaluate_json_pointer(data, "/products/0/name"), "Widget")
+        self.assertEqual(evaluate_json_pointer(data, "/products/0/name"), "Widget")
+        other = {"products": [{"name": "Gizmo"}]}
+        self.assertEqual(evaluate_json_pointer(other, "/products/0/name"), "Gizmo")
+
+    def test_root_and_empty_pointer(self):
+        """Test that the root and empty pointers return the whole document."""
+        data = {"a": 1}
+        self.assertIs(evaluate_json_pointer(data, ""), data)
+        self.assertIs(evaluate_json_pointer(data, "/"), data)
+
+    def test_unresolvable_pointer(self):
+        """Test that missing paths and invalid pointers return None."""
+        self.assertIsNone(evaluate_json_pointer({"a": 1}, "/b"))
+        self.assertIsNone(evaluate_json_pointer({"a": 1}, "no-leading-slash"))
+
+
+class TestLoadFiles(unittest.TestCase):
+    """Test cases for the local file loaders."""
+
+    def test_load_utf8_documents(self):
+        """Test that JSON and YAML files are decoded as UTF-8 regardless of locale."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            json_path = os.path.join(tmp_dir, "workflow.arazzo.json")
+            yaml_path = os.path.join(tmp_dir, "openapi.yaml")
+            with open(json_path, "wb") as f:
+                f.write('{"info": {"title": "Caf\u00e9 \u2013 API"}}'.encode())
+            with open(yaml_path, "wb") as f:
+                f.write("info:\n  title: Caf\u00e9 \u2013 API\n".encode())
+
+            self.assertEqual(load_arazzo_doc(json_path)["info"]["title"], "Caf\u00e9 \u2013 API")
+            self.assertEqual(load_openapi_file(yaml_path)["info"]["title"], "Caf\u00e9 \u2013 API")
+
+
+class TestLoadSourceDescriptions(unittest.TestCase):
+    """Test cases for the load_source_descriptions function."""
+
+    def test_local_sources_relative_to_arazzo_path(self):
+        """Test that local sources are resolved next to the Arazzo document."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(os.path.join(tmp_dir, "api.json"), "w") as f:
+                json.dump({"openapi": "3.0.0", "info": {"title": "JSON API"}}, f)
+            with open(os.path.join(tmp_dir, "api.yaml"), "w") as f:
+                f.write("openapi: 3.0.0\ninfo:\n  title: YAML API\n")
+
+            arazzo_doc = {
+                "sourceDescriptions": [
+                    {"name": "jsonApi", "url": "api.json"},
+                    {"name": "yamlApi", "url": "api.yaml"},
+                    {"name": "incomplete"},
+                ]
+            }
+            sources = load_source_descriptions(
+                arazzo_doc, os.path.join(tmp_dir, "workflow.arazzo.yaml"), "", http_client=None
+            )
+
+        self.assertEqual(set(sources), {"jsonApi", "yamlApi"})
+        self.assertEqual(sources["jsonApi"]["info"]["title"], "JSON API")
+        self.assertEqual(sources["yamlApi"]["info"]["title"], "YAML API")
+
+    def test_local_source_parsed_once_per_call(self):
+        """Test that sources sharing a local file share one parse, but only within a call."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source_path = os.path.join(tmp_dir, "api.json")
+            with open(source_path, "w") as f:
+                json.dump({"info": {"title": "AAAA"}}, f)
+            arazzo_doc = {
+                "sourceDescriptions": [
+                    {"name": "api", "url": "api.json"},
+                    {"name": "apiAlias", "url": "api.json"},
+                ]
+            }
+
+            first = load_source_descriptions(arazzo_doc, "", tmp_dir, http_client=None)
+            self.assertIs(first["api"], first["apiAlias"])
+
+            # Changes made to a loaded document do not leak into later loads
+            first["api"]["info"]["title"] = "Mutated"
+            second = load_source_descriptions(arazzo_doc, "", tmp_dir, http_client=None)
+            self.assertEqual(second["api"]["info"]["title"], "AAAA")
+
+            # Same size and mtime, different content
+            stat = os.stat(source_path)
+            with open(source_path, "w") as f:
+                json.dump({"info": {"title": "BBBB"}}, f)
+            os.utime(source_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            third = load_source_descriptions(arazzo_doc, "", tmp_dir, http_client=None)
+
+        self.assertEqual(third["api"]["info"]["title"], "BBBB")
+
+    def test_remote_sources(self):
+        """Test that remote sources are parsed as YAML or JSON from the response body."""
+        responses = {
+            "https://example.com/api.json": MagicMock(
+                headers={"Content-Type": "application/json"}, content=b'{"openapi": "3.0.0"}'
+            ),
+            "https://example.com/api": MagicMock(
+                headers={"Content-Type": "Application/X-YAML"}, content=b"openapi: 3.1.0\n"
+            ),
+            "https://example.com/api.yml": MagicMock(
+                headers={"Content-Type": "text/plain"}, content=b"openapi: 3.0.3\n"
+            ),
+        }
+        http_client = MagicMock()
+        http_client.get.side_effect = responses.__getitem__
+        arazzo_doc = {
+            "sourceDescriptions": [
+                {"name": "jsonApi", "url": "https://example.com/api.json"},
+                {"name": "yamlApi", "url": "https://example.com/api"},
+                {"name": "ymlApi", "url": "https://example.com/api.yml"},
+            ]
+        }
+
+        sources = load_source_descriptions(arazzo_doc, "", "", http_client)
+
+        self.assertEqual(sources["jsonApi"], {"openapi": "3.0.0"})
+        self.assertEqual(sources["yamlApi"], {"openapi": "3.1.0"})
+        self.assertEqual(sources["ymlApi"], {"openapi": "3.0.3"})
+
+    def test_remote_sources_keep_declared_order(self):
+        """Test that concurrently fetched sources keep document order and skip failures."""
+
+        def get(url):
+            if url.endswith("broken.json"):
+                raise ConnectionError("unreachable")
+            return MagicMock(
+                headers={"Content-Type": "application/json"},
+                content=b'{"url": "%s"}' % url.encode(),
+            )
+
+        http_client = MagicMock()
+        http_client.get.side_effect = get
+        names = [f"api{i}" for i in range(12)]
+        arazzo_doc = {
+            "sourceDescriptions": [
+                {"name": name, "url": f"https://example.com/{name}.json"} for name in names
+            ]
+            + [{"name": "broken", "url": "https://example.com/broken.json"}]
+        }
+
+        sources = load_source_descriptions(arazzo_doc, "", "", http_client)
+
+        self.assertEqual(list(sources), names)
+        self.assertEqual(sources["api5"], {"url": "https://example.com/api5.json"})
+        self.assertEqual(http_client.get.call_count, 13)
+
+    def test_remote_source_aliases_fetched_once(self):
+        """Test that sources sharing a URL are fetched once and bound to the same document."""
+        http_client = MagicMock()
+        http_client.get.return_value = MagicMock(
+            headers={"Content-Type": "application/json"}, content=b'{"openapi": "3.0.0"}'
+        )
+        arazzo_doc = {
+            "sourceDescriptions": [
+                {"name": "petsV1", "url": "https://example.com/pets.json"},
+                {"name": "petsAlias", "url": "https://example.com/pets.json"},
+            ]
+        }
+
+        sources = load_source_descriptions(arazzo_doc, "", "", http_client)
+
+        http_client.get.assert_called_once_with("https://example.com/pets.json")
+        self.assertEqual(list(sources), ["petsV1", "petsAlias"])
+        self.assertIs(sources["petsV1"], sources["petsAlias"])
+
+    def test_default_session_is_closed(self):
+        """Test that the session created when no http_client is given is closed after use."""
+        arazzo_doc = {
+            "sourceDescriptions": [{"name": "api", "url": "https://example.com/api.json"}]
+        }
+
+        with patch("arazzo_runner.utils.requests.Session") as session_cls:
+            session = session_cls.return_value.__enter__.return_value
+            session.get.return_value = MagicMock(
+                headers={"Content-Type": "application/json"}, content=b'{"openapi": "3.0.0"}'
+            )
+            sources = load_source_descriptions(arazzo_doc, "", "", None)
+
+        self.assertEqual(sources, {"api": {"openapi": "3.0.0"}})
+        session.get.assert_called_once_with("https://example.com/api.json")
+        session_cls.return_value.__exit__.assert_called_once()
+
+    def test_missing_local_source(self):
+        """Test that an unresolvable local source raises FileNotFoundError."""
+        arazzo_doc = {"sourceDescriptions": [{"name": "api", "url": "does-not-exist.yaml"}]}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with self.assertRaises(FileNotFoundError):
+                load_source_descriptions(
+                    arazzo_doc, os.path.join(tmp_dir, "workflow.arazzo.yaml"), "", None
+                )
+
+
+class TestDeprecated(unittest.TestCase):
+    """Test cases for the deprecated decorator."""
+
+    def test_warns_on_every_call(self):
+        """Test that each call warns and deduplication is left to the warnings filter."""
+
+        @deprecated("Use something else")
+        def old_function(value):
+            """Old function."""
+            return value * 2
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            self.assertEqual(old_function(1), 2)
+            self.assertEqual(old_function(2), 4)
+
+        self.assertEqual(len(caught), 2)
+        self.assertIs(caught[0].category, DeprecationWarning)
+        self.assertIn("old_function is deprecated: Use something else", str(caught[0].message))
+        self.assertEqual(caught[0].filename, __file__)
+        self.assertEqual(old_function.__name__, "old_function")
+
+        # The default action reports each calling location once
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("default")
+            for value in range(3):
+                old_function(value)
+            old_function(3)
+
+        self.assertEqual(len(caught), 2)
+
+
+class TestDumpState(unittest.TestCase):
+    """Test cases for the dump_state function."""
+
+    def test_skipped_when_debug_disabled(self):
+        """Test that the state is not formatted unless DEBUG logging is enabled."""
+        step_outputs = MagicMock()
+        state = SimpleNamespace(
+            workflow_id="wf",
+            current_step_id="step",
+            inputs={},
+            step_outputs=step_outputs,
+            workflow_outputs={},
+            status="running",
+        )
+
+        runner_logger = logging.getLogger("arazzo-runner")
+        previous_level = runner_logger.level
+        runner_logger.setLevel(logging.INFO)
+        try:
+            dump_state(state)
+        finally:
+            runner_logger.setLevel(previous_level)
+        step_outputs.items.assert_not_called()
+
+        with self.assertLogs("arazzo-runner", level="DEBUG") as logs:
+            step_outputs.items.return_value = [("step", {"id": 1})]
+            dump_state(state, "Test State")
+        self.assertIn("=== Test State ===", logs.output[0])
+        self.assertTrue(any("step: {'id': 1}" in line for line in logs.output))